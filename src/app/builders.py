@@ -14,29 +14,47 @@ from structs.tower import Tower, TowerBase, TowerRoom, TowerRoof, TowerRoofAcces
 from structs.bridge import Bridge
 from structs.castle import Castle, CastleOutline, CastleBasement, CastleRoof, CastleTree, CastleEntrance
 from structs.interior import ExoticWoodInterior, NostalgicInterior, EndGameInterior
-from generators import line3D
+from generators import line3DArray
 from materials import BasePalette, BaseStairPalette, Concrete, CryingObsidian, TintedGlass, signBlock
-from helper import timer
+from helper import rng, timer, buffering
+
+# four 2D sectors (10x10) where the center of a tower will be chosen
+_TOWER_BOUNDS = np.array([
+    (-35, -35, -25, -25), # NW
+    (-35, +25, -25, +35), # SW
+    (+25, +25, +35, +35), # SE
+    (+25, -35, +35, -25)  # NE
+])
+_OPPOSITE_DISTRICT = {'nw': 'se', 'sw': 'ne', 'se': 'nw', 'ne': 'sw'}
+# NW, SW, SE, NE
+# negative x is east
+# positive x is west
+# negative z is north
+# positive z is south
+_BOUND_MARKERS = (
+    ((-1, -1), 'blue', 'NW'),
+    ((-1, +1), 'yellow', 'SW'),
+    ((+1, +1), 'green', 'SE'),
+    ((+1, -1), 'red', 'NE')
+)
+_CONCRETE = {color: Concrete(color) for color in ('white', 'blue', 'yellow', 'green', 'red')}
+# palettes are never mutated (variants are made with `withStates`), so they can be shared
+_BASE_PALETTE = BasePalette()
+_BASE_STAIR_PALETTE = BaseStairPalette()
 
 @timer
 def buildBounds(editor: Editor, buildRect: Box, y: int) -> None:
     """ Place the bounds of the build area. """
 
     center: ivec3 = addY(buildRect.center, y)
-    geometry.placeRectOutline(editor, buildRect, center.y, Concrete('white'))
+    # the outline is placed block by block, so send it together with the markers
+    with buffering(editor):
+        geometry.placeRectOutline(editor, buildRect, center.y, _CONCRETE['white'])
 
-    # NW, SW, SE, NE
-    # negative x is east
-    # positive x is west
-    # negative z is north
-    # positive z is south
-    directions = [(-1, -1), (-1, +1), (+1, +1), (+1, -1)]
-    colors = ['blue', 'yellow', 'green', 'red']
-
-    for (x, z), color, district in zip(directions, colors, ['NW', 'SW', 'SE', 'NE']):
-        xz = center + ivec3(x * 50, 0, z * 50)
-        editor.placeBlock(line3D(xz, xz + ivec3(0, 10, 0)), Concrete(color))
-        editor.placeBlock(xz + ivec3(0, 11, 0), signBlock('birch', facing='north', line2=district))
+        for (x, z), color, district in _BOUND_MARKERS:
+            xz = center + ivec3(x * 50, 0, z * 50)
+            editor.placeBlock(line3DArray(xz, xz + ivec3(0, 10, 0)), _CONCRETE[color])
+            editor.placeBlock(xz + ivec3(0, 11, 0), signBlock('birch', facing='north', line2=district))
 
 
 @timer
@@ -46,44 +64,36 @@ def buildTowers(editor: Editor, center: ivec3, heightMap: np.ndarray) -> dict[st
     Returns a dictionary with the towers.
     """
 
-    basePalette = BasePalette()
-    baseStairPalette = BaseStairPalette()
-
-    # create four 2D sectors (10x10) where the center of a tower will be chosen
-    bounds = [
-        (-35, -35, -25, -25), # NW
-        (-35, +25, -25, +35), # SW
-        (+25, +25, +35, +35), # SE
-        (+25, -35, +35, -25)  # NE
-    ]
     towers = {district: None for district in ['nw', 'sw', 'se', 'ne']}
     interiorTypes = ['nostalgic', 'crimson', 'warped', 'endgame']
     while True:
         # shuffle until nostalgic and endgame differ by exactly 2 indices
-        np.random.shuffle(interiorTypes)
+        rng.shuffle(interiorTypes)
         if np.abs(interiorTypes.index('nostalgic') - interiorTypes.index('endgame')) == 2:
             break
     
-    for (minx, minz, maxx, maxz), district, interiorType in zip(bounds, towers.keys(), interiorTypes):
-        x = center.x + np.random.randint(minx, maxx)
-        z = center.z + np.random.randint(minz, maxz)
+    # one (x, z) offset per sector, drawn in a single call
+    offsets = rng.integers(_TOWER_BOUNDS[:, :2], _TOWER_BOUNDS[:, 2:])
+    for (dx, dz), district, interiorType in zip(offsets.tolist(), towers.keys(), interiorTypes):
+        x = center.x + dx
+        z = center.z + dz
 
         towerBase = TowerBase(
             origin = ivec3(x, center.y, z),
             district = district,
-            material = basePalette,
+            material = _BASE_PALETTE,
             height = 15,
             radius = 10
         )
         towerRoom = TowerRoom(
             origin = towerBase.o + Y * towerBase.height,
-            material = basePalette,
+            material = _BASE_PALETTE,
             height = 8,
             radius = 11
         )
         towerRoof = TowerRoof(
             origin = towerRoom.o + Y * towerRoom.height,
-            baseMaterial = basePalette,
+            baseMaterial = _BASE_PALETTE,
             coneMaterial = CryingObsidian,
             beaconColor = 'purple',
             height = 10,
@@ -93,8 +103,8 @@ def buildTowers(editor: Editor, center: ivec3, heightMap: np.ndarray) -> dict[st
         towerRoofAccess = TowerRoofAccess(
             origin = towerRoof.o + sign * X * (towerRoom.radius-1),
             district = district, 
-            baseMaterial = basePalette,
-            stairMaterial = baseStairPalette,
+            baseMaterial = _BASE_PALETTE,
+            stairMaterial = _BASE_STAIR_PALETTE,
             gateMaterial = CryingObsidian,
             roomHeight = towerRoom.height
         )
@@ -122,18 +132,16 @@ def buildCastle(editor: Editor, relativeCenter: ivec3, absoluteCenter: ivec3, he
     Returns the castle.
     """
 
-    basePalette = BasePalette()
-
     castleOutline = CastleOutline(
         origin = relativeCenter,
-        baseMaterial = basePalette,
+        baseMaterial = _BASE_PALETTE,
         wallHeight = 30,
         basementHeight = 10,
         width = 10
     )
     castleBasement = CastleBasement(
         origin = castleOutline.o - Y * castleOutline.basementHeight,
-        baseMaterial = basePalette,
+        baseMaterial = _BASE_PALETTE,
         beaconColor = 'black',
         width = castleOutline.width,
     )
@@ -164,19 +172,19 @@ def buildCastle(editor: Editor, relativeCenter: ivec3, absoluteCenter: ivec3, he
 def buildBridges(editor: Editor, towers: dict[str, Tower]) -> None:
     """ Place the bridges between the towers. """
     
-    basePalette = BasePalette()
-    baseStairPalette = BaseStairPalette()
-    noRoof = [[0, 3], [1, 2]][np.random.randint(0, 2)]
+    noRoof = [[0, 3], [1, 2]][rng.integers(0, 2)]
 
     nw, sw, se, ne = towers.values()
-    for i, towerSet in enumerate([(nw, sw), (nw, ne), (sw, se), (ne, se)]):
-        bridge = Bridge(
-            towers = towerSet,
-            baseMaterial = basePalette,
-            stairMaterial = baseStairPalette,
-            hasRoof = False if i in noRoof else True
-        )
-        bridge.place(editor)
+    # all four bridges together fit in a single request
+    with buffering(editor):
+        for i, towerSet in enumerate([(nw, sw), (nw, ne), (sw, se), (ne, se)]):
+            bridge = Bridge(
+                towers = towerSet,
+                baseMaterial = _BASE_PALETTE,
+                stairMaterial = _BASE_STAIR_PALETTE,
+                hasRoof = False if i in noRoof else True
+            )
+            bridge.place(editor)
     
     return
 
@@ -193,17 +201,17 @@ def buildEntryPoints(editor: Editor, castle: Castle, towers: dict[str, Tower]) -
     levels = (tower.base.height + tower.extensionHeight) // 5
     towerStairway = TowerStairway(
         towerBase = tower.base,
-        material = BaseStairPalette(),
+        material = _BASE_STAIR_PALETTE,
         levels = levels
     )
     towerStairway.place(editor)
 
-    dC = {'nw': 'se', 'sw': 'ne', 'se': 'nw', 'ne': 'sw'}[dT]
+    dC = _OPPOSITE_DISTRICT[dT]
 
     castleEntrance = CastleEntrance(
         origin = castle.outline.corners[dC] + 20 * Y,
         district = dC,
-        material = BasePalette()
+        material = _BASE_PALETTE
     )
     castleEntrance.place(editor)
 
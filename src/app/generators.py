@@ -1,15 +1,127 @@
 #!/usr/bin/env python3
 
-from typing import Generator
+from typing import Iterable
+from functools import lru_cache
 
-from gdpc import geometry, Block
-from glm import ivec3
-from gdpc.vector_tools import fittingCylinder, Y, cuboid3D, line3D
+import numpy as np
 
+from glm import ivec2, ivec3
+from gdpc.vector_tools import fittingCylinder
+from gdpc.vector_tools import Rect, fittingEllipse, filled2D
 
-def pyramid(origin: ivec3, height: int, hollow: bool = False) -> Generator[ivec3, None, None]:
+
+_NO_POINTS = np.empty((0, 3), dtype=np.int32)
+_NO_POINTS.flags.writeable = False
+
+
+def toArray(points: Iterable[ivec3]) -> np.ndarray:
+    """ Materialize a collection of points as an (N, 3) integer array. """
+    return np.fromiter(points, dtype=np.dtype((np.int32, 3)))
+
+
+def columns(origins: np.ndarray, lengths: np.ndarray, start: int = 0, step: int | np.ndarray = 1) -> np.ndarray:
+    """
+    Generate the positions for vertical columns of blocks, one for every origin.
+
+    Params:
+    - origins (np.ndarray): (N, 3) array with the origin of each column
+    - lengths (np.ndarray): the number of blocks in each column (counted from `start`)
+    - start (int): the offset of the first block w.r.t. the origin
+    - step (int | np.ndarray): +1 for columns going up, -1 for columns going down (or one per column)
+
+    The columns are returned back to back in a single (sum(lengths - start), 3) array.
+    """
+    counts = np.asarray(lengths) - start
+    points = np.repeat(origins, counts, axis=0)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    if np.ndim(step):
+        step = np.repeat(step, counts)
+    points[:, 1] += step * (offsets + start)
+    return points
+
+
+def line3DArray(begin: ivec3, end: ivec3) -> np.ndarray:
+    """
+    Generate the positions for the blocks of a line as an (N, 3) array.
+
+    The points are exactly the ones of gdpc's `line3D` (so a line from a point to itself is empty).
+    """
+    begin, end = np.array(begin), np.array(end)
+    delta = end - begin
+    steps = int(np.abs(delta).max())
+    if steps == 0:
+        return np.empty((0, 3), dtype=np.int32)
+    points = begin + delta * np.arange(steps + 1)[:, np.newaxis] / steps
+    return np.rint(points).astype(np.int32)
+
+
+def cuboid3DArray(corner1: ivec3, corner2: ivec3) -> np.ndarray:
+    """ Generate the positions for the blocks of a cuboid as an (N, 3) array. """
+    lo, hi = np.minimum(corner1, corner2), np.maximum(corner1, corner2) + 1
+    grid = np.mgrid[lo[0]:hi[0], lo[1]:hi[1], lo[2]:hi[2]]
+    return grid.reshape(3, -1).T.astype(np.int32)
+
+
+def fittingCylinderArray(corner1: ivec3, corner2: ivec3, tube: bool = False, hollow: bool = False) -> np.ndarray:
+    """
+    Generate the positions for the blocks of the largest cylinder that fits between two corners
+    as an (N, 3) array.
+
+    The shape is exactly the one of gdpc's `fittingCylinder`, but it only has to be rasterized
+    once per size: the result is translated to the corners with a single array add.
+    """
+    lo, hi = np.minimum(corner1, corner2), np.maximum(corner1, corner2)
+    return _fittingCylinderOffsets(tuple((hi - lo).tolist()), tube, hollow) + lo.astype(np.int32)
+
+
+@lru_cache(maxsize=None)
+def _fittingCylinderOffsets(size: tuple[int, int, int], tube: bool, hollow: bool) -> np.ndarray:
+    """
+    The points of a fitting cylinder between the origin and `size`.
+
+    Only the 2D base is rasterized (by gdpc), the layers above it are stacked with NumPy
+    in the same order as `fittingCylinder` yields them. Flat shapes are left to gdpc.
+    """
+    sx, sy, sz = size
+    if sx == 0 or sz == 0:
+        points = toArray(fittingCylinder(ivec3(0, 0, 0), ivec3(*size), tube=tube, hollow=hollow))
+        points.flags.writeable = False
+        return points
+    outline = list(fittingEllipse(ivec2(0, 0), ivec2(sx, sz)))
+    base = outline if tube else list(filled2D(outline, ivec2(sx, sz) // 2, Rect.between(ivec2(0, 0), ivec2(sx, sz))))
+    base = np.array(base, dtype=np.int32).reshape(-1, 2)
+    body = np.array(outline, dtype=np.int32).reshape(-1, 2) if tube or hollow else base
+    # bottom layer, top layer, then the body layers from bottom to top
+    heights = [np.zeros(len(base), dtype=np.int32)]
+    layers = [base]
+    if sy:
+        heights += [np.full(len(base), sy, dtype=np.int32), np.repeat(np.arange(1, sy, dtype=np.int32), len(body))]
+        layers += [base, np.tile(body, (sy - 1, 1))]
+    layers, heights = np.concatenate(layers), np.concatenate(heights)
+    points = np.column_stack([layers[:, 0], heights, layers[:, 1]])
+    points.flags.writeable = False
+    return points
+
+
+def triangleArray(origin: ivec3, size: int, direction: str) -> np.ndarray:
+    """
+    Generate the positions for the blocks of an isosceles triangle in the xz plane as an (N, 3) array.
+
+    Params:
+    - size (int): the size of the triangle sides (including origin)
+    - direction (str): the directions in which to extend the triangle
+    """
+    assert direction in ['nw', 'ne', 'sw', 'se']
+    xSign, zSign = {'nw': (-1, -1), 'ne': (+1, -1), 'sw': (-1, +1), 'se': (+1, +1)}[direction]
+    x, z = np.nonzero(np.add.outer(np.arange(size), np.arange(size)) < size)
+    points = np.zeros((len(x), 3), dtype=np.int32)
+    points[:, 0], points[:, 2] = x * xSign, z * zSign
+    return points + np.array(origin, dtype=np.int32)
+
+
+def pyramidArray(origin: ivec3, height: int, hollow: bool = False) -> np.ndarray:
     """
-    Generate the positions for the blocks of a pyramid.
+    Generate the positions for the blocks of a pyramid as an (N, 3) array.
 
     Params:
     - height (int): the height of the pyramid
@@ -25,23 +137,16 @@ def pyramid(origin: ivec3, height: int, hollow: bool = False) -> Generator[ivec3
         1 1 1 1 1
     ```
     """
-    for y in range(height):
-        from_ = -height + y + 1
-        to_   = +height - y
-        for x in range(from_, to_):
-            for z in range(from_, to_):
-                if hollow and not (abs(x) == to_-1 or abs(z) == to_-1):
-                    continue
-                yield origin + ivec3(x, y, z)
+    return _pyramidOffsets(height, hollow) + np.array(origin, dtype=np.int32)
 
 
-def cone(origin: ivec3, height: int, hollow: bool = False) -> Generator[ivec3, None, None]:
+def coneArray(origin: ivec3, height: int, hollow: bool = False) -> np.ndarray:
     """
-    Generate the positions for the blocks of a cone.
+    Generate the positions for the blocks of a cone as an (N, 3) array.
 
     Params:
     - height (int): the height of the cone
-    - hollow (bool): whether the cone should be hollow or not
+    - hollow (bool): whether the cone should be hollow or not (only the blocks without a block above them)
     
     The base width (diameter) will be `2 * height - 1`.
     For example, the heightmap of a cone with height 3 will look like this:
@@ -53,31 +158,57 @@ def cone(origin: ivec3, height: int, hollow: bool = False) -> Generator[ivec3, N
         0 1 1 1 0
     ```
     """
-    allPoints = []
+    return _coneOffsets(height, hollow) + np.array(origin, dtype=np.int32)
 
-    for y in range(height):
-        from_ = origin + (-height + y + 1, y, -height + y + 1)
-        to_   = origin + (+height - y - 1, y, +height - y - 1)
-        points = [point for point in fittingCylinder(from_, to_)]
-        allPoints.extend(points)
-    
+
+@lru_cache(maxsize=None)
+def _coneOffsets(height: int, hollow: bool) -> np.ndarray:
+    """ The points of a cone with its origin at (0, 0, 0), built from cached cylinder layers. """
+    if height <= 0:
+        return _NO_POINTS
+    points = np.concatenate([fittingCylinderArray(
+        ivec3(-height + y + 1, y, -height + y + 1),
+        ivec3(+height - y - 1, y, +height - y - 1)
+    ) for y in range(height)])
     # if hollow, remove points that have a point directly above them
     if hollow:
-        allPointsCopy = set(allPoints)
-        allPoints = [point for point in allPoints if not point + Y in allPointsCopy]
+        points = points[np.isin(pack(points + (0, 1, 0)), pack(points), invert=True)]
+    points.flags.writeable = False
+    return points
 
-    yield from allPoints
-                
-def triangle(origin: ivec3, size: int, direction: str) -> Generator[ivec3, None, None]:
-    """
-    Generate the positions for the blocks of an isosceles triangle in the xz plane.
 
-    Params:
-    - size (int): the size of the triangle sides (including origin)
-    - direction (str): the directions in which to extend the triangle
+@lru_cache(maxsize=None)
+def _pyramidOffsets(height: int, hollow: bool) -> np.ndarray:
+    """ The points of a pyramid with its origin at (0, 0, 0), computed once per size. """
+    if height <= 0:
+        return _NO_POINTS
+    y, x, z = np.mgrid[0:height, -height + 1:height, -height + 1:height]
+    ring, level = np.maximum(np.abs(x), np.abs(z)), height - 1 - y
+    mask = ring == level if hollow else ring <= level
+    points = np.column_stack([x[mask], y[mask], z[mask]]).astype(np.int32)
+    points.flags.writeable = False
+    return points
+
+
+_PACK_OFFSET = 1 << 20
+
+
+def pack(points: np.ndarray) -> np.ndarray:
     """
-    assert direction in ['nw', 'ne', 'sw', 'se']
-    xSign, zSign = {'nw': (-1, -1), 'ne': (+1, -1), 'sw': (-1, +1), 'se': (+1, +1)}[direction]
-    for x in range(size):
-        for z in range(size-x):
-                yield origin + ivec3(x * xSign, 0, z * zSign)
+    Pack an (N, 3) array of points into N int64 keys (21 bits per coordinate),
+    so that points can be hashed and compared as plain integers.
+    """
+    points = np.asarray(points).reshape(-1, 3)
+    x, y, z = (points[:, i].astype(np.int64) + _PACK_OFFSET for i in range(3))
+    return x | (y << 21) | (z << 42)
+
+
+def difference(points: np.ndarray, other: np.ndarray) -> np.ndarray:
+    """ Return the points (rows) that do not occur in `other`, keeping their order. """
+    return points[np.isin(pack(points), pack(other), invert=True)]
+
+
+def unique(points: np.ndarray) -> np.ndarray:
+    """ Return the points (rows) without duplicates, in order of first occurrence. """
+    _, index = np.unique(pack(points), return_index=True)
+    return points[np.sort(index)]
@@ -5,21 +5,89 @@ Helper functions to make main.py more readable.
 """
 
 import sys
+import random
+from typing import Iterable, List, Optional, Sequence, Union
 from time import perf_counter
 from functools import wraps
+from contextlib import contextmanager
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 from gdpc import __url__
-from gdpc import Editor, Box, Rect, WorldSlice
+from gdpc import Editor, Block, Box, Rect, WorldSlice
+from gdpc.vector_tools import Vec3iLike
 from gdpc.exceptions import InterfaceConnectionError, BuildAreaNotSetError
 
 
+# max. number of buffered blocks per request, a whole tower part fits in one request
+BUFFER_LIMIT = 8192
+
+# the one random generator of the project, see `seed` to make a run reproducible
+rng = np.random.default_rng()
+
+
+def seed(value: int | None = None) -> None:
+    """
+    Seed the random generator (and Python's `random`, which gdpc uses to sample some palettes).
+    The generator is reseeded in place, so modules that imported it keep using it.
+    """
+    rng.bit_generator.state = np.random.default_rng(value).bit_generator.state
+    random.seed(value)
+
+
+class PaletteSamplingEditor(Editor):
+    """
+    An Editor that samples a palette for a whole array of positions with a single NumPy call,
+    instead of drawing a block with `random.choice` for every position.
+    """
+
+    def placeBlock(
+        self,
+        position: Union[Vec3iLike, Iterable[Vec3iLike]],
+        block:    Union[Block, Sequence[Block]],
+        replace:  Optional[Union[str, List[str]]] = None
+    ) -> bool:
+        """
+        Like `Editor.placeBlock`, but if <position> is an (N, 3) array and <block> a palette,
+        the blocks for all positions are drawn at once and every distinct block is placed in one call.
+        Repeated blocks in the palette act as its weights.
+        """
+        if not isinstance(position, np.ndarray) or position.ndim != 2 or isinstance(block, Block):
+            return super().placeBlock(position, block, replace)
+        counts: dict[int, list] = {}
+        for b in block:
+            counts.setdefault(id(b), [b, 0])[1] += 1
+        blocks, weights = zip(*counts.values())
+        choice = rng.choice(len(blocks), size=len(position), p=np.array(weights) / sum(weights))
+        place = super().placeBlock
+        # the groups together still make a single request if the editor is not buffering yet
+        with buffering(self):
+            return all([place(position[choice == i], b, replace) for i, b in enumerate(blocks)])
+
+
+class ChunkSortedEditor(Editor):
+    """
+    An Editor that sends its buffered blocks ordered by chunk section,
+    so that the server touches every section it writes to only once per request.
+    """
+
+    def flushBuffer(self):
+        self._buffer = dict(sorted(
+            self._buffer.items(),
+            key = lambda item: (item[0].x >> 4, item[0].z >> 4, item[0].y >> 4)
+        ))
+        super().flushBuffer()
+
+
+class BuildEditor(PaletteSamplingEditor, ChunkSortedEditor):
+    """ The editor used to build the city: palettes are sampled per array, buffers sent by chunk section. """
+
+
 def getEditor() -> Editor:
     """ Instantiate an Editor object and check if it can connect to the GDMC HTTP interface. """
     
-    editor = Editor()
+    # buffers are flushed on the main thread, so a failed request raises where it happens
+    editor = BuildEditor(bufferLimit = BUFFER_LIMIT)
 
     try:
         editor.checkConnection()
@@ -54,17 +122,25 @@ def getBuildArea(editor: Editor) -> Box:
 
 def createOverview(editor: Editor, buildRect: Rect) -> None:
     """ Create an overview of the worldSlice loaded from the build area. """
+    # matplotlib is only needed here, so it is not imported at startup
+    from matplotlib.figure import Figure
 
-    worldSlice: WorldSlice = editor.loadWorldSlice(buildRect)
+    # the slice is reloaded to show the finished structures, but only the heightmap we draw is decoded
+    worldSlice: WorldSlice = editor.loadWorldSlice(buildRect, heightmapTypes=['MOTION_BLOCKING_NO_LEAVES'])
     heightMap: np.ndarray = worldSlice.heightmaps['MOTION_BLOCKING_NO_LEAVES']
     # transpose to get the correct orientation
     heightMap = heightMap.T
     shp = heightMap.shape[0]
 
-    fig, ax = plt.subplots()
+    # a bare Figure renders straight to an Agg canvas, without pyplot's backend and figure manager
+    fig = Figure()
+    ax = fig.subplots()
     ax.imshow(heightMap, cmap='terrain')
-    ax.set_xticks(np.arange(0, shp, 10), np.arange(-shp//2+1, shp//2+1, 10))
-    ax.set_yticks(np.arange(0, shp, 10), np.arange(-shp//2+1, shp//2+1, 10))
+    # the same ticks on both axes, labelled relative to the center
+    ticks = np.arange(0, shp, 10)
+    labels = ticks + (-shp//2+1)
+    ax.set_xticks(ticks, labels)
+    ax.set_yticks(ticks, labels)
     ax.set_xlabel('X')
     ax.set_ylabel('Z')
 
@@ -73,7 +149,6 @@ def createOverview(editor: Editor, buildRect: Rect) -> None:
 
     fig.tight_layout()
     fig.savefig('../../overview.png', dpi=300)
-    plt.close(fig)
 
 def timer(func):
     @wraps(func)
@@ -85,3 +160,34 @@ def timer(func):
         print(f'\rFinished building {func.__name__[5:].lower()} in {end - start:.2f} seconds')
         return result
     return wrapper
+
+
+@contextmanager
+def buffering(editor: Editor):
+    """
+    Buffer all block placements made inside the `with` block, and flush them when it exits.
+    If the editor is already buffering, the placements simply add to the outer buffer.
+    """
+    if editor.buffering:
+        yield editor
+        return
+    editor.buffering = True
+    try:
+        yield editor
+    finally:
+        # turning buffering off flushes the buffer
+        editor.buffering = False
+
+
+def buffered(func):
+    """
+    Decorator for `place(self, editor)` methods.
+    Buffers all block placements made by the method so that they are sent to the GDMC HTTP interface
+    in as few requests as possible, instead of one request per `editor.placeBlock` call.
+    Nested buffered calls simply add to the buffer of the outermost one.
+    """
+    @wraps(func)
+    def wrapper(self, editor, *args, **kwargs):
+        with buffering(editor):
+            return func(self, editor, *args, **kwargs)
+    return wrapper
@@ -12,32 +12,36 @@ from glm import ivec3
 from structs.tower import Tower
 from structs.castle import Castle
 from builders import buildBounds, buildTowers, buildCastle, buildBridges, buildEntryPoints, buildInteriors
-from helper import getEditor, getBuildArea, createOverview
+from helper import getEditor, getBuildArea, createOverview, seed
 
 
 def main():
 
     os.chdir(os.path.dirname(__file__))
 
+    # `--seed <n>` makes the random choices of a run reproducible
+    if '--seed' in sys.argv:
+        seed(int(sys.argv[sys.argv.index('--seed') + 1]))
+
     editor = getEditor()
     buildArea = getBuildArea(editor)
     buildRect = buildArea.toRect()
 
-    worldSlice = editor.loadWorldSlice(buildRect)
+    worldSlice = editor.loadWorldSlice(buildRect, heightmapTypes=['OCEAN_FLOOR', 'MOTION_BLOCKING_NO_LEAVES'])
 
     heightMaps: tuple[np.ndarray] = (worldSlice.heightmaps['OCEAN_FLOOR'], worldSlice.heightmaps['MOTION_BLOCKING_NO_LEAVES'])
     base = np.max(heightMaps[1])
 
     start = perf_counter()
 
-    if len(sys.argv) > 1 and sys.argv[1] == '--dev':
+    if '--dev' in sys.argv:
         buildBounds(editor, buildRect, base)
 
     absoluteCenter: ivec3 = addY(buildRect.center, base)
 
     towers: dict[str, Tower] = buildTowers(editor, absoluteCenter, heightMaps)
 
-    relativeCenter = sum([tower.o for tower in towers.values()]) / 4
+    relativeCenter = sum((tower.o for tower in towers.values()), ivec3()) / 4
     
     castle: Castle = buildCastle(editor, relativeCenter, absoluteCenter, heightMaps)
 
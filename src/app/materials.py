@@ -5,8 +5,10 @@ All materials will be defined here, so palettes as well as single blocks.
 """
 
 from typing import Sequence
+from functools import lru_cache
+
 from gdpc import Block
-from gdpc.minecraft_tools import signBlock
+from gdpc.minecraft_tools import signBlock as _signBlock
 
 
 class Palette:
@@ -17,12 +19,19 @@ class Palette:
     def __iter__(self):
         return iter(self.blocks)
 
+    def withStates(self, **states: str) -> 'Palette':
+        """ A copy of this palette with the given states set on every block. """
+        # blocks that are repeated in the palette share their copy as well
+        copies = {id(block): Block(block.id, {**block.states, **states}, block.data) for block in self.blocks}
+        return Palette([copies[id(block)] for block in self.blocks])
+
 
-basePalette = [Block(id) for id in 
-    7 * ['stone_bricks'] +
-    2 * ['cracked_stone_bricks'] +
-    1 * ['mossy_stone_bricks']
-]
+# one Block per id, repeated to get the weights
+basePalette = (
+    7 * [Block('stone_bricks')] +
+    2 * [Block('cracked_stone_bricks')] +
+    1 * [Block('mossy_stone_bricks')]
+)
 class BasePalette(Palette):
     """
     70% stone bricks,
@@ -32,10 +41,10 @@ class BasePalette(Palette):
     def __init__(self):
         super().__init__(basePalette)
 
-baseSlabPalette = [Block(id) for id in
-    8 * ['stone_brick_slab'] +
-    2 * ['mossy_stone_brick_slab']
-]
+baseSlabPalette = (
+    8 * [Block('stone_brick_slab')] +
+    2 * [Block('mossy_stone_brick_slab')]
+)
 class BaseSlabPalette(Palette):
     """
     80% stone brick slabs,
@@ -50,10 +59,10 @@ class BaseSlabPalette(Palette):
             block.states['type'] = type
 
 
-baseStairPalette = [Block(id) for id in
-    8 * ['stone_brick_stairs'] +
-    2 * ['mossy_stone_brick_stairs']
-]
+baseStairPalette = (
+    8 * [Block('stone_brick_stairs')] +
+    2 * [Block('mossy_stone_brick_stairs')]
+)
 class BaseStairPalette(Palette):
     """
     80% stone brick stairs,
@@ -99,6 +108,29 @@ GrassBlock = Block('grass_block')
 SpruceLog = Block('spruce_log', {'axis': 'y'})
 Water = Block('water')
 Lava = Block('lava')
-
+BirchPlanks = Block('birch_planks')
+BirchLeaves = Block('birch_leaves')
+BirchLog = Block('birch_log')
+DeepslateTiles = Block('deepslate_tiles')
+DeepslateTileWall = Block('deepslate_tile_wall')
+EndPortalBlock = Block('end_portal')
+CraftingTable = Block('crafting_table')
+Bookshelf = Block('bookshelf')
+GlowLichen = Block('glow_lichen', {d: 'true' for d in ['north', 'east', 'south', 'west', 'up', 'down']})
+
+@lru_cache(maxsize=None)
 def pot(plant: str) -> Block:
     return Block(f'potted_{plant}')
+
+@lru_cache(maxsize=None)
+def stateBlock(id: str, **states: str) -> Block:
+    """
+    A block with the given states, built once per combination.
+    Sharing it is safe, since placeBlock places a copy of the block.
+    """
+    return Block(id, states)
+
+@lru_cache(maxsize=None)
+def signBlock(*args, **kwargs) -> Block:
+    """ gdpc's `signBlock`, with the NBT data built only once per combination of arguments. """
+    return _signBlock(*args, **kwargs)
@@ -4,15 +4,20 @@
 The bridge class is defined here.
 """
 
-from typing import Generator, Sequence
+from typing import Sequence
+from functools import cached_property
+
 import numpy as np
 
 from gdpc import Block, Editor
-from glm import ivec3
 
-from generators import line3D
 from .tower import Tower
+from helper import rng, buffered
+
 
+# column order that maps (walk, y, across) coordinates to (x, y, z)
+_AXES = {'x': [0, 1, 2], 'z': [2, 1, 0]}
+_STAIRS_DIRECTIONS = {'x': ('south', 'north'), 'z': ('east', 'west')}
 
 class Bridge:
     """ A bridge connecting two towers. """
@@ -50,65 +55,57 @@ class Bridge:
             raise ValueError(f'Invalid direction: {self.direction}')
         return
 
+    @buffered
     def place(self, editor: Editor) -> None:
         """ Place the bridge in Minecraft. """
         editor.placeBlock(self.baseG, self.baseM)
+        stairsPC = self.stairsPC
         for i in range(4):
-            self.stairM.setFacing(self.stairsDirections[i%2])
-            self.stairM.setHalf('top')
-            if i >= 2:
-                self.stairM.setHalf('bottom')
-            editor.placeBlock(self.stairsPC[i], self.stairM)
+            half = 'bottom' if i >= 2 else 'top'
+            stairs = self.stairM.withStates(facing=self.stairsDirections[i%2], half=half)
+            editor.placeBlock(stairsPC[i], stairs)
         return
 
     @property
-    def baseG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the bridge base. """
-        for a in self.walkRange:
-            b = self._getB(a)
-            # yield self.p(a, b, 0)
-            yield from line3D(self.p(a, b-1, 0), self.p(a, b+1, 0))
-            yield from [self.p(a, b-2, 1), self.p(a, b+2, 1)]
-            if self.hasRoof:
-                yield from line3D(self.p(a, b-1, 4), self.p(a, b+1, 4))
-                yield self.p(a, b, 5)
-                if np.random.rand() < 0.5:
-                    sign = np.random.choice([-1, 1])
-                    yield from [self.p(a, b + sign*2, 2), self.p(a, b + sign*2, 3)]
-        return
+    def baseG(self) -> np.ndarray:
+        """ Point collection for positions of the bridge base. """
+        a, b = self.walkA, self.walkB
+        pcs = [self.p(a, b+db, 0) for db in (-1, 0, +1)]
+        pcs += [self.p(a, b-2, 1), self.p(a, b+2, 1)]
+        if self.hasRoof:
+            pcs += [self.p(a, b+db, 4) for db in (-1, 0, +1)]
+            pcs += [self.p(a, b, 5)]
+            # random pillars on either side of the bridge
+            pillars = rng.random(len(a)) < 0.5
+            sign = 2 * rng.integers(0, 2, size=pillars.sum()) - 1
+            a, b = a[pillars], b[pillars] + sign*2
+            pcs += [self.p(a, b, 2), self.p(a, b, 3)]
+        return np.concatenate(pcs)
+
     @property
-    def basePC(self) -> Sequence[ivec3]:
+    def basePC(self) -> np.ndarray:
         """ Positions of the bridge base. """
-        return list(self.baseG)
+        return self.baseG
     
     @property
-    def stairsPC(self) -> Sequence[Sequence[ivec3]]:
+    def stairsPC(self) -> Sequence[np.ndarray]:
         """ Positions of the four sets of decorative stairs. """
-        stairsPC = [[], [], [], []]
-        for a in self.walkRange:
-            b = self._getB(a)
-            stairsPC[0].append(self.p(a, b-2, 0))
-            stairsPC[1].append(self.p(a, b+2, 0))
-            if self.hasRoof:
-                stairsPC[2].extend([self.p(a, b-2, 4), self.p(a, b-1, 5)])
-                stairsPC[3].extend([self.p(a, b+2, 4), self.p(a, b+1, 5)])
+        a, b = self.walkA, self.walkB
+        stairsPC = [self.p(a, b-2, 0), self.p(a, b+2, 0)]
+        if self.hasRoof:
+            stairsPC.append(np.concatenate([self.p(a, b-2, 4), self.p(a, b-1, 5)]))
+            stairsPC.append(np.concatenate([self.p(a, b+2, 4), self.p(a, b+1, 5)]))
+        else:
+            stairsPC += [np.empty((0, 3), dtype=np.int32)] * 2
         return stairsPC
 
-    def p(self, i: int, j: int, k: int) -> ivec3:
+    def p(self, i: int | np.ndarray, j: int | np.ndarray, k: int) -> np.ndarray:
         """ helper method for switching between x and z directions """
-        if self.direction == 'x':
-            return ivec3(i, self.from_.y+k, j)
-        else:
-            return ivec3(j, self.from_.y+k, i)
-    
-    def _getB(self, a: int) -> int:
-        """ helper method for getting the z coordinate of the bridge at a given x coordinate or vice versa. """
-        if self.direction == 'x':
-            return round(self.from_.z + (self.to_.z - self.from_.z) * (a - self.from_.x) / (self.to_.x - self.from_.x))
-        else:
-            return round(self.from_.x + (self.to_.x - self.from_.x) * (a - self.from_.z) / (self.to_.z - self.from_.z))
+        i, j = np.broadcast_arrays(i, j)
+        y = np.full(i.shape, self.from_.y+k)
+        return np.stack([i, y, j], axis=-1).astype(np.int32)[..., _AXES[self.direction]]
     
-    @property
+    @cached_property
     def direction(self) -> str:
         """ The direction of the bridge, either 'x' or 'z'. """
         if self.towers[0].district[1] == self.towers[1].district[1]:
@@ -121,7 +118,7 @@ class Bridge:
                 f'{self.towers[0].district}, {self.towers[1].district}'
             )
     
-    @property
+    @cached_property
     def walkRange(self) -> range:
         """ Direction to loop over when determining point collections. """
         return {
@@ -129,10 +126,21 @@ class Bridge:
             'z': range(self.from_.z+1, self.to_.z)
         }[self.direction]
 
-    @property
-    def stairsDirections(self) -> tuple[str, str]:
-        """ Get the directions of the stairs. """
+    @cached_property
+    def walkA(self) -> np.ndarray:
+        """ Coordinates along the walking direction of the bridge. """
+        return np.arange(self.walkRange.start, self.walkRange.stop)
+
+    @cached_property
+    def walkB(self) -> np.ndarray:
+        """ Coordinates of the bridge center perpendicular to the walking direction, for every `walkA`. """
         if self.direction == 'x':
-            return ('south', 'north')
+            f, t = (self.from_.x, self.from_.z), (self.to_.x, self.to_.z)
         else:
-            return ('east', 'west')
+            f, t = (self.from_.z, self.from_.x), (self.to_.z, self.to_.x)
+        return np.rint(f[1] + (t[1] - f[1]) * (self.walkA - f[0]) / (t[0] - f[0])).astype(int)
+
+    @cached_property
+    def stairsDirections(self) -> tuple[str, str]:
+        """ Get the directions of the stairs. """
+        return _STAIRS_DIRECTIONS[self.direction]
@@ -4,17 +4,24 @@
 All castle-related classes are defined here.
 """
 
-from typing import Generator, Sequence
+from typing import Sequence
+from functools import cached_property
 
 import numpy as np
 
 from gdpc import Block, Editor
 from gdpc.vector_tools import Y
-from gdpc.minecraft_tools import signBlock
 from glm import ivec3
 
-from generators import fittingCylinder, cuboid3D, line3D, pyramid, cone
-from materials import Air, Glass, Netherite, Water, Lava, Beacon, Magma, EndStoneBricks, EndStoneBrickWall, SpruceLog, SpruceLeaves
+from generators import pyramidArray, coneArray, toArray, columns
+from generators import line3DArray, cuboid3DArray, fittingCylinderArray
+from materials import stateBlock, signBlock, Air, Glass, Netherite, Water, Lava, Beacon, Magma, EndStoneBricks, EndStoneBrickWall, SpruceLog, SpruceLeaves
+from helper import rng, buffered
+
+
+_ENTRANCE_X_SIGN = {'w': +1, 'e': -1}
+_ENTRANCE_Z_SIGN = {'n': +1, 's': -1}
+_ENTRANCE_SIGN_ROTATION = {'sw': 2, 'nw': 6, 'ne': 10, 'se': 14}
 
 
 class CastleOutline:
@@ -38,14 +45,13 @@ class CastleOutline:
         self.width = width
         return
     
+    @buffered
     def place(self, editor: Editor) -> None:
         """ Place the castle outline in minecraft """
-        editor.placeBlock(self.mainFloorG, self.baseM)
-        editor.placeBlock(self.basementFloorG, self.baseM)
-        editor.placeBlock(self.roofG, self.baseM)
-        editor.placeBlock(self.cornerPillarsG, self.baseM)
-        editor.placeBlock(self.coneBasesG, self.baseM)
-        editor.placeBlock(self.wallsG, self.baseM)
+        editor.placeBlock(np.concatenate([
+            self.mainFloorG, self.basementFloorG, self.roofG,
+            self.cornerPillarsG, self.coneBasesG, self.wallsG
+        ]), self.baseM)
         editor.placeBlock(self.hollowOutG, Air)
         return
 
@@ -53,98 +59,88 @@ class CastleOutline:
         """ Extend the castle to the ground. """
 
         heightMapOF, heightMapMBNL = heightMaps
-        wallsPC = list(self.wallsG) + list(self.cornerPillarsG)
-        minY = min([p.y for p in wallsPC])
-        wallsSilhouette = set([p for p in wallsPC if p.y == minY])
-        for p in wallsSilhouette:
-            x, z = p.x - center.x - 51, p.z - center.z - 51
-            groundHeight = min(heightMapOF[x, z], heightMapMBNL[x, z])
-            buildHeight = p.y - groundHeight
-            editor.placeBlock(line3D(p, p - Y * buildHeight), self.baseM)
+        wallsPC = np.concatenate([self.wallsG, self.cornerPillarsG])
+        minY = wallsPC[:, 1].min()
+        wallsSilhouette = np.unique(wallsPC[wallsPC[:, 1] == minY], axis=0)
+        x, z = wallsSilhouette[:, 0] - center.x - 51, wallsSilhouette[:, 2] - center.z - 51
+        groundHeight = np.minimum(heightMapOF[x, z], heightMapMBNL[x, z])
+        buildHeight = wallsSilhouette[:, 1] - groundHeight
+        lengths = np.where(buildHeight != 0, np.abs(buildHeight) + 1, 0)
+        editor.placeBlock(columns(wallsSilhouette, lengths, step=-np.sign(buildHeight)), self.baseM)
 
     @property
-    def mainFloorG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the main floor. """
-        return cuboid3D(
+    def mainFloorG(self) -> np.ndarray:
+        """ Point collection for positions of the main floor. """
+        return cuboid3DArray(
             self.o + ivec3(-self.width, 0, -self.width),
             self.o + ivec3(+self.width, 0, +self.width)
         )
     
     @property
-    def basementFloorG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the basement floor. """
-        return cuboid3D(
+    def basementFloorG(self) -> np.ndarray:
+        """ Point collection for positions of the basement floor. """
+        return cuboid3DArray(
             self.o + ivec3(-self.width, -self.basementHeight, -self.width),
             self.o + ivec3(+self.width, -self.basementHeight, +self.width)
         )
     
     @property
-    def roofG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the roof. """
-        return cuboid3D(
-            self.o + ivec3(-self.width, self.wallHeight, -self.width),
-            self.o + ivec3(+self.width, self.wallHeight, +self.width)
+    def roofG(self) -> np.ndarray:
+        """ Point collection for positions of the roof, without the opening that is hollowed out anyway. """
+        w = self.width
+        pc = cuboid3DArray(
+            self.o + ivec3(-w, self.wallHeight, -w),
+            self.o + ivec3(+w, self.wallHeight, +w)
         )
+        opening = np.abs(pc[:, [0, 2]] - (self.o.x, self.o.z)).max(axis=1) <= w - 3
+        return pc[~opening]
     
     @property
-    def cornerPillarsG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the corner pillars. """
-        for cornerPos in self.corners.values():
-            yield from fittingCylinder(
-                cornerPos + ivec3(-3, -self.basementHeight, -3),
-                cornerPos + ivec3(+3, +self.wallHeight,     +3),
-                hollow = True
-            )
-            yield from fittingCylinder(
-                cornerPos + ivec3(-3, -self.basementHeight-1, -3),
-                cornerPos + ivec3(+3, -self.basementHeight-1, +3),
-                tube = True
-            )
-        return
+    def cornerPillarsG(self) -> np.ndarray:
+        """ Point collection for positions of the corner pillars. """
+        return np.concatenate([np.concatenate([fittingCylinderArray(
+            cornerPos + ivec3(-3, -self.basementHeight, -3),
+            cornerPos + ivec3(+3, +self.wallHeight,     +3),
+            hollow = True
+        ), fittingCylinderArray(
+            cornerPos + ivec3(-3, -self.basementHeight-1, -3),
+            cornerPos + ivec3(+3, -self.basementHeight-1, +3),
+            tube = True
+        )]) for cornerPos in self.corners.values()])
 
     @property
-    def coneBasesG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the cone base. """
-        for cornerPos in self.corners.values():
-            yield from fittingCylinder(
-                cornerPos + ivec3(-4, self.wallHeight + 1, -4),
-                cornerPos + ivec3(+4, self.wallHeight + 1, +4)
-            )
-        return
+    def coneBasesG(self) -> np.ndarray:
+        """ Point collection for positions of the cone base. """
+        return np.concatenate([fittingCylinderArray(
+            cornerPos + ivec3(-4, self.wallHeight + 1, -4),
+            cornerPos + ivec3(+4, self.wallHeight + 1, +4)
+        ) for cornerPos in self.corners.values()])
 
     @property
-    def wallsG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the walls. """
-        for i, currentCornerPos in enumerate(self.corners.values()):
-            if i == 3:
-                nextCornerPos = self.corners[list(self.corners.keys())[0]]
-            else:
-                nextCornerPos = self.corners[list(self.corners.keys())[i+1]]
-            yield from cuboid3D(
-                currentCornerPos - Y * (self.basementHeight+1),
-                nextCornerPos + Y * self.wallHeight
-            )
-        return
+    def wallsG(self) -> np.ndarray:
+        """ Point collection for positions of the walls. """
+        corners = list(self.corners.values())
+        return np.concatenate([cuboid3DArray(
+            currentCornerPos - Y * (self.basementHeight+1),
+            nextCornerPos + Y * self.wallHeight
+        ) for currentCornerPos, nextCornerPos in zip(corners, corners[1:] + corners[:1])])
 
     @property
-    def hollowOutG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the hollow out. """
+    def hollowOutG(self) -> np.ndarray:
+        """ Point collection for positions of the hollow out. """
         w, wH, bH = self.width, self.wallHeight, self.basementHeight
-        yield from cuboid3D(
+        return np.concatenate([cuboid3DArray(
             self.o + ivec3(-w + 1,    +1, -w + 1),
             self.o + ivec3(+w - 1, wH -1, +w - 1)
-        )
-        yield from cuboid3D(
+        ), cuboid3DArray(
             self.o + ivec3(-w + 1, -bH + 1, -w + 1),
             self.o + ivec3(+w - 1,      -1, +w - 1)
-        )
-        yield from cuboid3D(
+        ), cuboid3DArray(
             self.o + ivec3(-w + 3, wH, -w + 3),
             self.o + ivec3(+w - 3, wH, +w - 3)
-        )
-        return
+        )])
     
-    @property
+    @cached_property
     def corners(self) -> dict[str, ivec3]:
         """ Get the corners' coordinates. """
         w = self.width
@@ -176,12 +172,13 @@ class CastleBasement:
         self.width = width
         return
     
+    @buffered
     def place(self, editor: Editor) -> None:
         """ Place the castle basement in minecraft """
         editor.placeBlock(self.lavaG, Lava)
         editor.placeBlock(self.landingStructureG, Netherite)
         editor.placeBlock(self.o + 2 * Y, Beacon)
-        editor.placeBlock(self.o + 3 * Y, Block(f'{self.beaconColor}_stained_glass_pane'))
+        editor.placeBlock(self.o + 3 * Y, stateBlock(f'{self.beaconColor}_stained_glass_pane'))
         editor.placeBlock(self.o + 4 * Y, Air)
         editor.placeBlock(self.o + 5 * Y, Water)
         editor.placeBlock(self.parkourBaseBlocksG, EndStoneBricks)
@@ -191,55 +188,52 @@ class CastleBasement:
         return
 
     @property
-    def lavaG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the lava. """
-        yield from [
-            p for p in cuboid3D(
-                self.o + ivec3(-self.width+1, 1, -self.width+1),
-                self.o + ivec3(+self.width-1, 1, +self.width-1)
-            ) if np.random.rand() < .5
-        ]
-        return
+    def lavaG(self) -> np.ndarray:
+        """ Point collection for positions of the lava (about half of the basement floor). """
+        pc = cuboid3DArray(
+            self.o + ivec3(-self.width+1, 1, -self.width+1),
+            self.o + ivec3(+self.width-1, 1, +self.width-1)
+        )
+        return pc[rng.random(len(pc)) < .5]
 
     @property
-    def landingStructureG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the landing structure. """
-        return cuboid3D(
+    def landingStructureG(self) -> np.ndarray:
+        """ Point collection for positions of the landing structure. """
+        return cuboid3DArray(
             self.o + ivec3(-1, 1, -1),
             self.o + ivec3(+1, 5, +1)
         )
     
     @property
-    def parkourBaseBlocksG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the parkour base blocks. """
-        for x in range(3, 8, 2):
-            yield(self.o + ivec3(x, 1, 0))
-        yield self.o + ivec3(7, 1, -7)
-        yield from cuboid3D(
-            self.o + ivec3(7, 4, -7),
-            self.o + ivec3(9, 4, -9)
-        )
-        return
+    def parkourBaseBlocksG(self) -> np.ndarray:
+        """ Point collection for positions of the parkour base blocks. """
+        return np.concatenate([
+            toArray([self.o + ivec3(x, 1, 0) for x in range(3, 8, 2)] + [self.o + ivec3(7, 1, -7)]),
+            cuboid3DArray(
+                self.o + ivec3(7, 4, -7),
+                self.o + ivec3(9, 4, -9)
+            )
+        ])
     
     @property
-    def parkourWallBlocksG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the parkour wall blocks. """
-        for x in range(3, 8, 2):
-            for y in range(2, 6):
-                if x == 7 and y == 5:
-                    continue
-                yield(self.o + ivec3(x, y, 0))
-        for z in range(0, -5, -2):
-            yield(self.o + ivec3(9, 4, z))
-        yield self.o + ivec3(9, 5, -5)
-        yield self.o + ivec3(7, 2, -7)
-        yield self.o + ivec3(7, 3, -7)
-        yield self.o + ivec3(8, 5, -7)
-        yield from line3D(
-            self.o + ivec3(7, 5, -7),
-            self.o + ivec3(7, 5, -9)
-        )
-        return
+    def parkourWallBlocksG(self) -> np.ndarray:
+        """ Point collection for positions of the parkour wall blocks. """
+        return np.concatenate([
+            line3DArray(self.o + ivec3(3, 2, 0), self.o + ivec3(3, 5, 0)),
+            line3DArray(self.o + ivec3(5, 2, 0), self.o + ivec3(5, 5, 0)),
+            line3DArray(self.o + ivec3(7, 2, 0), self.o + ivec3(7, 4, 0)),
+            toArray(self.o + ivec3(9, 4, z) for z in range(0, -5, -2)),
+            toArray([
+                self.o + ivec3(9, 5, -5),
+                self.o + ivec3(7, 2, -7),
+                self.o + ivec3(7, 3, -7),
+                self.o + ivec3(8, 5, -7)
+            ]),
+            line3DArray(
+                self.o + ivec3(7, 5, -7),
+                self.o + ivec3(7, 5, -9)
+            )
+        ])
     
     @property
     def chest(self) -> Block:
@@ -279,6 +273,7 @@ class CastleRoof:
         self.height = height
         return
     
+    @buffered
     def place(self, editor: Editor) -> None:
         """ Place the castle roof in minecraft """
         editor.placeBlock(self.roofPyramidG, self.roofM)
@@ -288,16 +283,17 @@ class CastleRoof:
         return
 
     @property
-    def roofPyramidG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the roof pyramid. """
-        return pyramid(self.o, self.height, True)
+    def roofPyramidG(self) -> np.ndarray:
+        """ Point collection for positions of the roof pyramid. """
+        return pyramidArray(self.o, self.height, True)
 
     @property
-    def conesG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the cones. """
-        for corner in self.corners.values():
-            yield from cone(ivec3(corner.x, self.o.y + 1, corner.z), 4)
-        return
+    def conesG(self) -> np.ndarray:
+        """ Point collection for positions of the cones. """
+        return np.concatenate([
+            coneArray(ivec3(corner.x, self.o.y + 1, corner.z), 4)
+            for corner in self.corners.values()
+        ])
 
 
 class CastleTree:
@@ -333,11 +329,12 @@ class CastleTree:
             self.trunkHeight = y
             if np.sum(slice_) == 1:
                 break
-            if np.random.rand() < dropRate:
+            if rng.random() < dropRate:
                 x, z = self.furthestIndex(slice_)
                 slice_[x, z] = False
                 dropRate *= dropRate
 
+    @buffered
     def place(self, editor: Editor) -> None:
         """ Place the tree in the Minecraft. """
         editor.placeBlock(self.pedestalG, EndStoneBricks)
@@ -346,48 +343,43 @@ class CastleTree:
         editor.placeBlock(self.trunkG, SpruceLog)
 
     @property
-    def pedestalG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the pedestal. """
-        return cuboid3D(
+    def pedestalG(self) -> np.ndarray:
+        """ Point collection for positions of the pedestal. """
+        return cuboid3DArray(
             self.o + ivec3(-self.r, -3, -self.r),
             self.o + ivec3(+self.r, -1, +self.r)
         )
     
     @property
-    def pedestalCutoutG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the pedestal cutout. """
-        for x, z in [(-1, -1), (-1, +1), (+1, -1), (+1, +1), (0, 0)]:
-            yield from line3D(
-                self.o + ivec3(self.r * x, -3, self.r * z),
-                self.o + ivec3(self.r * x, -1, self.r * z)
-            )
-        return
+    def pedestalCutoutG(self) -> np.ndarray:
+        """ Point collection for positions of the pedestal cutout. """
+        return np.concatenate([line3DArray(
+            self.o + ivec3(self.r * x, -3, self.r * z),
+            self.o + ivec3(self.r * x, -1, self.r * z)
+        ) for x, z in [(-1, -1), (-1, +1), (+1, -1), (+1, +1), (0, 0)]])
 
     @property
-    def leavesG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the leaves. """
-        return fittingCylinder(
+    def leavesG(self) -> np.ndarray:
+        """ Point collection for positions of the leaves. """
+        return fittingCylinderArray(
             self.o + ivec3(-8, self.trunkHeight-9, -8),
             self.o + ivec3(+8, self.trunkHeight+5, +8)
         )
 
     @property
-    def trunkG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the trunk. """
-        yield from [
-            self.o + ivec3(x-self.r, y, z-self.r)
-            for y in range(self.trunkHeight) for x in range(self.d) for z in range(self.d)
-            if self.trunkA[y, x, z]
-        ]
-        return
+    def trunkG(self) -> np.ndarray:
+        """ Point collection for the trunk. """
+        y, x, z = np.nonzero(self.trunkA[:self.trunkHeight])
+        pc = np.stack([x - self.r, y, z - self.r], axis=1)
+        return (pc + np.array(self.o)).astype(np.int32)
     
     def furthestIndex(self, A: np.ndarray) -> tuple[int, int]:
-        """ Return the furthest index from the center of the trunk. """
-        A = np.argwhere(A == True)
-        A = A[np.argmax(np.linalg.norm(A - (self.r, self.r), axis=1))]
-        if A.shape != (2,):
-            A = A[np.random.randint(len(A))]
-        return (A[0], A[1])
+        """ Return the furthest index from the center of the trunk (a random one in case of a tie). """
+        A = np.argwhere(A)
+        d2 = ((A - self.r)**2).sum(axis=1)
+        furthest = np.flatnonzero(d2 == d2.max())
+        i = furthest[0] if len(furthest) == 1 else rng.choice(furthest)
+        return (A[i, 0], A[i, 1])
 
 
 class Castle:
@@ -412,6 +404,7 @@ class Castle:
         self.tree = tree
         return
 
+    @buffered
     def place(self, editor: Editor) -> None:
         """ Place the castle in minecraft """
         self.outline.place(editor)
@@ -423,19 +416,19 @@ class Castle:
         return
     
     @property
-    def lavaG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the lava on the main floor. """
+    def lavaG(self) -> np.ndarray:
+        """ Point collection for positions of the lava on the main floor. """
         w, h = self.outline.width, self.outline.wallHeight
-        yield from [
-            p for p in cuboid3D(
-                self.o + ivec3(-w+1, 1, -w+1),
-                self.o + ivec3(+w-1, 1, +w-1)
-            ) if np.random.rand() < .5
-        ]
-        for x, z in [(1, 1), (1, -1), (-1, 1), (-1, -1)]:
-            yield self.o + ivec3(x * (w-1), h-1, z * (w-1))
-            yield self.o + ivec3(x * (w+1), h-1, z * (w+1))
-        return
+        pc = cuboid3DArray(
+            self.o + ivec3(-w+1, 1, -w+1),
+            self.o + ivec3(+w-1, 1, +w-1)
+        )
+        pc = pc[rng.random(len(pc)) < .5]
+        corners = toArray(
+            self.o + ivec3(x * (w+dw), h-1, z * (w+dw))
+            for x, z in [(1, 1), (1, -1), (-1, 1), (-1, -1)] for dw in (-1, +1)
+        )
+        return np.concatenate([pc, corners])
 
 
 class CastleEntrance:
@@ -452,6 +445,7 @@ class CastleEntrance:
         self.district = district
         return
 
+    @buffered
     def place(self, editor: Editor) -> None:
         """ Place the entrance in the Minecraft. """
         editor.placeBlock(self.platformsG, self.material)
@@ -465,72 +459,67 @@ class CastleEntrance:
     @property
     def xSign(self) -> int:
         """ The sign of the x coordinate of the entrance. """
-        return {'w': +1, 'e': -1}[self.district[1]]
+        return _ENTRANCE_X_SIGN[self.district[1]]
     
     @property
     def zSign(self) -> int:
         """ The sign of the z coordinate of the entrance. """
-        return {'n': +1, 's': -1}[self.district[0]]
+        return _ENTRANCE_Z_SIGN[self.district[0]]
 
     @property
-    def platformsG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the platforms. """
-        yield from fittingCylinder(
+    def platformsG(self) -> np.ndarray:
+        """ Point collection for positions of the platforms. """
+        return np.concatenate([fittingCylinderArray(
             self.o + ivec3(-3, 0, -3),
             self.o + ivec3(+3, 0, +3)
-        )
-        yield from fittingCylinder(
+        ), fittingCylinderArray(
             self.o + ivec3(-3, 4, -3),
             self.o + ivec3(+3, 4, +3)
-        )
-        return
+        )])
     
     @property
-    def lavaGuardG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the lava guard. """
-        return fittingCylinder(
+    def lavaGuardG(self) -> np.ndarray:
+        """ Point collection for positions of the lava guard. """
+        return fittingCylinderArray(
             self.o + ivec3(-3, 5, -3),
             self.o + ivec3(+3, 5, +3),
             tube = True
         )
 
     @property
-    def markingG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the marking. """
-        yield from line3D(
+    def markingG(self) -> np.ndarray:
+        """ Point collection for positions of the marking. """
+        return np.concatenate([line3DArray(
             self.o + ivec3(self.xSign * -3, 0, self.zSign * -1),
             self.o + ivec3(self.xSign * -3, 4, self.zSign * -1)
-        )
-        yield from line3D(
+        ), line3DArray(
             self.o + ivec3(self.xSign * -1, 0, self.zSign * -3),
             self.o + ivec3(self.xSign * -1, 4, self.zSign * -3)
-        )
-        yield self.o + ivec3(self.xSign * -2, 0, self.zSign * -2)
-        yield self.o + ivec3(self.xSign * -2, 4, self.zSign * -2)
-        return
+        ), toArray([
+            self.o + ivec3(self.xSign * -2, 0, self.zSign * -2),
+            self.o + ivec3(self.xSign * -2, 4, self.zSign * -2)
+        ])])
 
     @property
-    def cutoutsG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the cutouts. """
-        yield from line3D(
+    def cutoutsG(self) -> np.ndarray:
+        """ Point collection for positions of the cutouts. """
+        return np.concatenate([line3DArray(
             self.o + ivec3(self.xSign * -2, 1, self.zSign * -2),
             self.o + ivec3(self.xSign * -2, 3, self.zSign * -2)
-        )
-        yield from cuboid3D(
+        ), cuboid3DArray(
             self.o + Y,
             self.o + ivec3(self.xSign * 2, 3, self.zSign * 2)
-        )
-        return
+        )])
     
     @property
-    def poleG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the pole in the middle. """
-        return line3D(self.o + Y, self.o + 3 * Y)
+    def poleG(self) -> np.ndarray:
+        """ Point collection for positions of the pole in the middle. """
+        return line3DArray(self.o + Y, self.o + 3 * Y)
 
     @property
     def textSign(self) -> str:
         """ A text sign with a hint. """
-        rotation = {'sw': 2, 'nw': 6, 'ne': 10, 'se': 14}[self.district]
+        rotation = _ENTRANCE_SIGN_ROTATION[self.district]
         return signBlock(
             wood = 'spruce', rotation = rotation,
             line1 = 'Look', line2 = 'for', line3 = 'the', line4 = 'Light',
@@ -4,7 +4,7 @@
 Four different interiors for the tower rooms.
 """
 
-from typing import Generator, Sequence
+from functools import cached_property
 
 import numpy as np
 
@@ -13,8 +13,51 @@ from gdpc.vector_tools import Y
 from glm import ivec3
 
 from .tower import Tower
-from generators import cuboid3D, fittingCylinder, line3D, triangle
-from materials import BaseSlabPalette, pot, signBlock, Air, Chain, Lantern, SoulLantern, GrassBlock
+from generators import line3DArray, triangleArray, columns
+from generators import cuboid3DArray, fittingCylinderArray, difference, unique
+from materials import BaseSlabPalette, pot, stateBlock, signBlock, Air, Chain, Lantern, SoulLantern, GrassBlock, Water
+from materials import BirchPlanks, BirchLeaves, BirchLog, DeepslateTiles, DeepslateTileWall, EndPortalBlock, CraftingTable, Bookshelf, GlowLichen
+from helper import rng, buffered
+
+
+# lookup tables for the district letters
+_FACING = {'n': 'north', 'e': 'east', 's': 'south', 'w': 'west'}
+_OPPOSITE = {'n': 's', 'e': 'w', 's': 'n', 'w': 'e'}
+# facing of blocks that look back towards the center of the room
+_FACING_BACK = {d: _FACING[_OPPOSITE[d]] for d in _FACING}
+_X_SIGN = {'w': -1, 'e': 1}
+_Z_SIGN = {'n': -1, 's': 1}
+
+
+# geometry relative to the origin of its structure (for a southern district, i.e. z sign +1),
+# so that it is only computed once and instances just have to mirror and translate it
+_HOUSE_OUTLINE = difference(cuboid3DArray((-3, 1, 3), (3, 5, 9)), cuboid3DArray((-2, 1, 4), (2, 4, 9)))
+_HOUSE_BACK_WALL = difference(cuboid3DArray((-2, 1, 10), (2, 5, 10)), np.concatenate([
+    cuboid3DArray((0, 2, 10), (0, 5, 10)),
+    cuboid3DArray((-1, 4, 10), (1, 4, 10))
+]))
+_TREE_LEAVES = np.concatenate([
+    fittingCylinderArray((-1, 3, -2), (-7, 5, -8)),
+    fittingCylinderArray((-2, 6, -3), (-6, 6, -7)),
+    cuboid3DArray((-3, 7, -4), (-5, 7, -6))
+])
+_SLAB_3X3 = cuboid3DArray((-1, 0, -1), (1, 0, 1))
+_SLAB_5X5 = cuboid3DArray((-2, 0, -2), (2, 0, 2))
+_RING_5X5 = difference(_SLAB_5X5, _SLAB_3X3)
+_RING_5X5_CORNERS = np.array([(-2, 0, -2), (-2, 0, 2), (2, 0, -2), (2, 0, 2)], dtype=np.int32)
+_SLAB_3X3_CORNERS = np.array([(-1, 0, -1), (-1, 0, 1), (1, 0, -1), (1, 0, 1)], dtype=np.int32)
+# the sides of the end portal frame (without the corners), by the way the frame blocks face
+_END_PORTAL_FRAME = {
+    'south': cuboid3DArray((-1, 0, -2), (1, 0, -2)),
+    'north': cuboid3DArray((-1, 0, 2), (1, 0, 2)),
+    'east': cuboid3DArray((-2, 0, -1), (-2, 0, 1)),
+    'west': cuboid3DArray((2, 0, -1), (2, 0, 1))
+}
+
+
+def _translate(pc: np.ndarray, origin: ivec3, zSign: int = 1) -> np.ndarray:
+    """ Mirror a relative point collection along z (if `zSign` is -1) and move it to `origin`. """
+    return pc * np.array([1, 1, zSign], dtype=np.int32) + np.array(origin, dtype=np.int32)
 
 
 class Interior:
@@ -28,72 +71,73 @@ class Interior:
         return
 
     @property
-    def floorG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the floor. """
-        return fittingCylinder(
+    def floorG(self) -> np.ndarray:
+        """ Point collection for the floor. """
+        return fittingCylinderArray(
             self.o + ivec3(-self.radius, 0, -self.radius),
             self.o + ivec3(+self.radius, 0, +self.radius)
         )
 
     @property
-    def plinthG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the plinth. """
-        return fittingCylinder(
+    def plinthG(self) -> np.ndarray:
+        """ Point collection for the plinth. """
+        return fittingCylinderArray(
             self.o + ivec3(-self.radius, 0, -self.radius),
             self.o + ivec3(+self.radius, 0, +self.radius),
             tube = True
         )
 
-    @property
-    def ceilingG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the ceiling. """
-        yield from [p for p in fittingCylinder(
+    @cached_property
+    def ceilingG(self) -> np.ndarray:
+        """ Point collection for the ceiling. """
+        pc = fittingCylinderArray(
             self.o + ivec3(-self.radius, self.height, -self.radius),
             self.o + ivec3(+self.radius, self.height, +self.radius)
-            ) if p.x != self.o.x + self.xSign * self.radius
-        ]
+        )
+        return pc[pc[:, 0] != self.o.x + self.xSign * self.radius]
 
     def _fixLanternChains(self, n: int) -> None:
         """ Static point collection for the lantern chains. """
         r, h = self.radius - 3, self.height
-        candidates = list(fittingCylinder(self.o + ivec3(-r, h, -r), self.o + ivec3(+r, h, +r)))
-        candidates = list(filter(lambda c: c not in self.invalidLanternPC, candidates))
-        self.lanternChainsPC = []
-        for o in [candidates[i] for i in np.random.choice(len(candidates), n, replace = False)]:
-            self.lanternChainsPC.append([o - Y * i for i in range(np.random.randint(1, 4))])
+        candidates = fittingCylinderArray(self.o + ivec3(-r, h, -r), self.o + ivec3(+r, h, +r))
+        candidates = difference(candidates, self.invalidLanternPC)
+        origins = candidates[rng.choice(len(candidates), n, replace=False, shuffle=False)]
+        lengths = rng.integers(1, 4, size=n)
+        self.lanternChainsPC = columns(origins, lengths, step = -1)
+        # every lantern hangs right below the last link of its chain
+        self.lanternsPC = self.lanternChainsPC[np.cumsum(lengths) - 1] - (0, 1, 0)
         return
     
     @property
-    def lanternChainsG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the lantern chains. """
-        for pc in self.lanternChainsPC:
-            yield from pc
+    def lanternChainsG(self) -> np.ndarray:
+        """ Point collection for the lantern chains. """
+        return self.lanternChainsPC
             
     @property
-    def lanternsG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the lanterns. """
-        for pc in self.lanternChainsPC:
-            yield pc[-1] - Y
+    def lanternsG(self) -> np.ndarray:
+        """ Point collection for the lanterns. """
+        return self.lanternsPC
     
-    def _getTextSign(self, facing: str, woodType: str) -> Block:
-        """ Get the text sign for the given direction. """
+    @staticmethod
+    def _getTextSign(facing: str, woodType: str) -> Block:
+        """ Get the text sign for the given direction (signBlock builds it once per direction and wood type). """
         return signBlock(
             wood = woodType, wall = True,
-            facing = {'n': 'north', 'e': 'east', 's': 'south', 'w': 'west'}[facing],
+            facing = _FACING[facing],
             line1 = 'When', line2 = 'You\'re Lost',
             line3 = 'in the', line4 = 'Darkness',
             color = 'black', isGlowing = True
         )
 
-    @property
+    @cached_property
     def xSign(self) -> int:
         """ Sign of the x coordinate. """
-        return {'w': -1, 'e': 1}[self.district[1]]
+        return _X_SIGN[self.district[1]]
     
-    @property
+    @cached_property
     def zSign(self) -> int:
         """ Sign of the z coordinate. """
-        return {'n': -1, 's': 1}[self.district[0]]
+        return _Z_SIGN[self.district[0]]
 
 
 class NostalgicInterior(Interior):
@@ -106,10 +150,11 @@ class NostalgicInterior(Interior):
         self._fixLanternChains(3)
         return
 
+    @buffered
     def place(self, editor: Editor) -> None:
         """ Place the interior in Minecraft. """
-        editor.placeBlock(self.floorG, Block('birch_slab', {'type': 'bottom'}))
-        editor.placeBlock(self.plinthG, Block('birch_planks'))
+        editor.placeBlock(self.floorG, stateBlock('birch_slab', type='bottom'))
+        editor.placeBlock(self.plinthG, BirchPlanks)
         editor.placeBlock(self.ceilingG, BaseSlabPalette('top'))
         editor.placeBlock(self.lanternChainsG, Chain)
         editor.placeBlock(self.lanternsG, Lantern)
@@ -119,87 +164,71 @@ class NostalgicInterior(Interior):
         editor.placeBlock(zE, self._getTextSign(self.district[0], 'birch'))
         self.garden.place(editor)
 
-        editor.placeBlock(self.houseOutlineG, Block('birch_planks'))
-        editor.placeBlock(self.houseBackWallG, Block('birch_planks'))
+        editor.placeBlock(self.houseOutlineG, BirchPlanks)
+        editor.placeBlock(self.houseBackWallG, BirchPlanks)
         editor.placeBlock(self.houseDoorG, Air)
         editor.placeBlock(
             self.o + ivec3(-2, 1, self.zSign * 3),
-            Block('birch_door', {'hinge': 'left', 'half': 'lower', 'facing': self.facing}))
+            stateBlock('birch_door', hinge='left', half='lower', facing=self.facing))
         editor.placeBlock(self.o + ivec3(-2, 3, self.zSign * 2), self.houseTextSign)
-        editor.placeBlock(self.o + ivec3(-1, 2, self.zSign * 2), Block('wall_torch', {'facing': {'n': 'south', 's': 'north'}[self.direction]}))
+        editor.placeBlock(self.o + ivec3(-1, 2, self.zSign * 2), stateBlock('wall_torch', facing=self.facingBack))
 
-        editor.placeBlock(self.o + ivec3(2, 1, self.zSign * 8), Block('white_bed', {'part': 'foot', 'facing': self.facing}))
+        editor.placeBlock(self.o + ivec3(2, 1, self.zSign * 8), stateBlock('white_bed', part='foot', facing=self.facing))
         editor.placeBlock(self.o + ivec3(2, 2, self.zSign * 9), self.bedTextSign)
         editor.placeBlock(self.o + ivec3(0, 2, self.zSign * 10), pot('orange_tulip'))
         lr1, lr2 = ('left', 'right') if self.direction == 's' else ('right', 'left')
-        editor.placeBlock(self.o + ivec3(-2, 1, self.zSign * 8), Block('chest', {'facing': 'east', 'type': lr1}))
-        editor.placeBlock(self.o + ivec3(-2, 1, self.zSign * 9), Block('chest', {'facing': 'east', 'type': lr2}))
+        editor.placeBlock(self.o + ivec3(-2, 1, self.zSign * 8), stateBlock('chest', facing='east', type=lr1))
+        editor.placeBlock(self.o + ivec3(-2, 1, self.zSign * 9), stateBlock('chest', facing='east', type=lr2))
         editor.placeBlock(
             self.o + ivec3(1, 1, self.zSign * 9),
             Block('chest',
-                {'facing': {'n': 'south', 's': 'north'}[self.direction]},
+                {'facing': self.facingBack},
                 data = f'{{Items:[{{Slot:13b,id:"minecraft:iron_sword",Count:1b}}]}}'
             ))
-        editor.placeBlock(self.o + ivec3(2, 1, self.zSign * 4), Block('crafting_table'))
-        editor.placeBlock(self.o + ivec3(2, 1, self.zSign * 6), Block('furnace', {'facing': 'west', 'lit': 'true'}))
-        editor.placeBlock(self.o + ivec3(0, 1, self.zSign * 4), Block('bookshelf'))
-        editor.placeBlock(self.o + ivec3(-2, 3, self.zSign * 4), Block('wall_torch', {'facing': self.facing}))
+        editor.placeBlock(self.o + ivec3(2, 1, self.zSign * 4), CraftingTable)
+        editor.placeBlock(self.o + ivec3(2, 1, self.zSign * 6), stateBlock('furnace', facing='west', lit='true'))
+        editor.placeBlock(self.o + ivec3(0, 1, self.zSign * 4), Bookshelf)
+        editor.placeBlock(self.o + ivec3(-2, 3, self.zSign * 4), stateBlock('wall_torch', facing=self.facing))
         return
 
-    @property
+    @cached_property
     def facing(self) -> str:
         """ The facing direction. """
-        return {'n': 'north', 's': 'south'}[self.direction]
-
-    @property
-    def houseOutlineG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the house outline. """
-        full = cuboid3D(
-            self.o + ivec3(-3, 1, self.zSign * 3),
-            self.o + ivec3(3, 5, self.zSign * 9)
-        )
-        inside = set(cuboid3D(
-            self.o + ivec3(-2, 1, self.zSign * 4),
-            self.o + ivec3(2, 4, self.zSign * 9)
-        ))
-        yield from [b for b in full if b not in inside]
-        return
-
-    @property
-    def houseBackWallG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the house back wall with a cross shape cutout. """
-        full = cuboid3D(
-            self.o + ivec3(-2, 1, self.zSign * 10),
-            self.o + ivec3(2, 5, self.zSign * 10)
-        )
-        cutout = list(line3D(
-            self.o + ivec3(0, 2, self.zSign * 10),
-            self.o + ivec3(0, 5, self.zSign * 10)
-        )) + list(line3D(
-            self.o + ivec3(-1, 4, self.zSign * 10),
-            self.o + ivec3(1, 4, self.zSign * 10)
-        ))
-        yield from [b for b in full if b not in cutout]
-        return
-
-    @property
-    def houseDoorG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the house door. """
-        return line3D(
+        return _FACING[self.direction]
+
+    @cached_property
+    def facingBack(self) -> str:
+        """ The facing direction towards the center of the room. """
+        return _FACING_BACK[self.direction]
+
+    @cached_property
+    def houseOutlineG(self) -> np.ndarray:
+        """ Point collection for the house outline. """
+        return _translate(_HOUSE_OUTLINE, self.o, self.zSign)
+
+    @cached_property
+    def houseBackWallG(self) -> np.ndarray:
+        """ Point collection for the house back wall with a cross shape cutout. """
+        return _translate(_HOUSE_BACK_WALL, self.o, self.zSign)
+
+    @cached_property
+    def houseDoorG(self) -> np.ndarray:
+        """ Point collection for the house door. """
+        return line3DArray(
             self.o + ivec3(-2, 1, self.zSign * 3),
             self.o + ivec3(-2, 2, self.zSign * 3)
         )
 
-    @property
+    @cached_property
     def houseTextSign(self) -> Block:
         """ The text sign for the house. """
         return signBlock(
-            wood = 'birch', wall = True, facing = {'n': 'south', 's': 'north'}[self.direction],
+            wood = 'birch', wall = True, facing = self.facingBack,
             line1 = 'live', line2 = 'laugh', line3 = 'love', line4 = 'craft',
             color = 'black'
         )
 
-    @property
+    @cached_property
     def bedTextSign(self) -> Block:
         """ The text sign for the bed. """
         return signBlock(
@@ -208,10 +237,12 @@ class NostalgicInterior(Interior):
             color = 'black'
         )
 
-    @property
-    def invalidLanternPC(self) -> Sequence[ivec3]:
+    @cached_property
+    def invalidLanternPC(self) -> np.ndarray:
         """ Invalid lantern point collection. """
-        return [ivec3(p.x, self.o.y + self.height, p.z) for p in [*self.houseOutlineG, *self.garden.treeLeavesG]]
+        invalid = np.concatenate([self.houseOutlineG, self.garden.treeLeavesG])
+        invalid[:, 1] = self.o.y + self.height
+        return invalid
 
 
 class EndGameInterior(Interior):
@@ -224,13 +255,13 @@ class EndGameInterior(Interior):
         self.endPortal = EndPortal(self.o + ivec3(0, 0, self.zSign * 7))
         self._fixLanternChains(20)
 
+    @buffered
     def place(self, editor: Editor) -> None:
         """ Place the interior in Minecraft. """
-        editor.placeBlock(self.floorG, Block('deepslate_tile_slab', {'type': 'bottom'}))
-        editor.placeBlock(self.plinthG, Block('deepslate_tiles'))
+        editor.placeBlock(self.floorG, stateBlock('deepslate_tile_slab', type='bottom'))
+        editor.placeBlock(self.plinthG, DeepslateTiles)
         editor.placeBlock(self.ceilingG, BaseSlabPalette('top'))
-        lichenStates = {d: 'true' for d in ['north', 'east', 'south', 'west', 'up', 'down']}
-        editor.placeBlock(self.lichenG, Block('glow_lichen', lichenStates))
+        editor.placeBlock(self.lichenG, GlowLichen)
         self.table.place(editor)
         editor.placeBlock(self.lanternChainsG, Chain)
         editor.placeBlock(self.lanternsG, SoulLantern)
@@ -239,33 +270,33 @@ class EndGameInterior(Interior):
         editor.placeBlock(xE, self._getTextSign(self.district[1], 'spruce'))
         editor.placeBlock(zE, self._getTextSign(self.district[0], 'spruce'))
         self.endPortal.place(editor)
-        editor.placeBlock(self.o + ivec3(0, 2, self.zSign * 7), Block('deepslate_tiles'))
+        editor.placeBlock(self.o + ivec3(0, 2, self.zSign * 7), DeepslateTiles)
         editor.placeBlock(
             self.o + ivec3(0, 3, self.zSign * 7),
-            Block('ender_chest', {'facing': {'n': 'south', 's': 'north'}[self.district[0]]})
+            stateBlock('ender_chest', facing=_FACING_BACK[self.district[0]])
         )
 
-    @property
-    def invalidLanternPC(self) -> Sequence[ivec3]:
+    @cached_property
+    def invalidLanternPC(self) -> np.ndarray:
         """ Invalid lantern point collection. """
-        return []
+        return np.empty((0, 3), dtype=np.int32)
 
-    @property
-    def ceilingG(self) -> Generator[ivec3, None, None]:
-        return fittingCylinder(
+    @cached_property
+    def ceilingG(self) -> np.ndarray:
+        return fittingCylinderArray(
             self.o + ivec3(-(self.radius-1), self.height, -(self.radius-1)),
             self.o + ivec3((self.radius-1), self.height, (self.radius-1))
         )
 
-    @property
-    def lichenG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the glow lichen. """
-        yield from [p for p in fittingCylinder(
-                self.o + ivec3(-self.radius, 1, -self.radius),
-                self.o + ivec3(self.radius, self.height, self.radius),
-                tube = True
-            ) if p.x != self.o.x + self.xSign * self.radius
-        ]
+    @cached_property
+    def lichenG(self) -> np.ndarray:
+        """ Point collection for the glow lichen. """
+        pc = fittingCylinderArray(
+            self.o + ivec3(-self.radius, 1, -self.radius),
+            self.o + ivec3(self.radius, self.height, self.radius),
+            tube = True
+        )
+        return pc[pc[:, 0] != self.o.x + self.xSign * self.radius]
 
 
 class ExoticWoodInterior(Interior):
@@ -277,7 +308,7 @@ class ExoticWoodInterior(Interior):
         self.kind = kind
         self.gardens = {district: None for district in ['nw', 'ne', 'sw', 'se']}
         for district in self.gardens.keys():
-            xs, zs = {'w': -1, 'e': 1}[district[1]], {'n': -1, 's': 1}[district[0]]
+            xs, zs = _X_SIGN[district[1]], _Z_SIGN[district[0]]
             gO = self.o + ivec3(xs * 3, 0, zs * 3)
             garden = ExoticGarden(gO, self.kind, self.height, district)
             self.gardens[district] = garden
@@ -290,10 +321,11 @@ class ExoticWoodInterior(Interior):
             self.lantern = SoulLantern
         return
 
+    @buffered
     def place(self, editor: Editor) -> None:
         """ Place the interior in Minecraft. """
-        editor.placeBlock(self.floorG, Block(f'{self.kind}_slab', {'type': 'bottom'}))
-        editor.placeBlock(self.plinthG, Block(f'{self.kind}_planks'))
+        editor.placeBlock(self.floorG, stateBlock(f'{self.kind}_slab', type='bottom'))
+        editor.placeBlock(self.plinthG, stateBlock(f'{self.kind}_planks'))
         editor.placeBlock(self.ceilingG, BaseSlabPalette('top'))
         editor.placeBlock(self.lanternChainsG, Chain)
         editor.placeBlock(self.lanternsG, self.lantern)
@@ -306,14 +338,11 @@ class ExoticWoodInterior(Interior):
         editor.placeBlock(zE, self._getTextSign(self.district[0], self.kind))
         return
         
-    @property
-    def invalidLanternPC(self) -> Sequence[ivec3]:
+    @cached_property
+    def invalidLanternPC(self) -> np.ndarray:
         """ Invalid lantern point collection. """
-        invalid = []
-        for garden in self.gardens.values():
-            invalid.extend(garden.hyphaeG)
-            invalid.extend(garden.boundsG)
-        return invalid
+        gardens = self.gardens.values()
+        return np.concatenate([g.hyphaeG for g in gardens] + [g.boundsG for g in gardens])
 
 
 class NostalgicGarden:
@@ -330,123 +359,106 @@ class NostalgicGarden:
         self.direction = direction
         return
 
+    @buffered
     def place(self, editor: Editor) -> None:
         """ Place the garden in Minecraft. """
         editor.placeBlock(self.grassBlocksG, GrassBlock)
-        editor.placeBlock(self.boundsG, Block('birch_planks'))
+        editor.placeBlock(self.boundsG, BirchPlanks)
         editor.placeBlock(self.floorGapG, Air)
-        editor.placeBlock(self.canalG, Block('water'))
-        editor.placeBlock(self.treeLeavesG, Block('birch_leaves'))
-        editor.placeBlock(self.treeTrunkG, Block('birch_log'))
+        editor.placeBlock(self.canalG, Water)
+        editor.placeBlock(self.treeLeavesG, BirchLeaves)
+        editor.placeBlock(self.treeTrunkG, BirchLog)
         return
     
-    @property
+    @cached_property
     def sign(self) -> int:
         """ The sign of the z coordinate. """
-        return {'n': -1, 's': 1}[self.direction]
+        return _Z_SIGN[self.direction]
     
-    @property
+    @cached_property
     def facing(self) -> str:
         """ The facing direction. """
-        return {'n': 'north', 's': 'south'}[self.direction]
+        return _FACING[self.direction]
 
-    @property
-    def treeTrunkG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the tree trunk. """
-        return line3D(
+    @cached_property
+    def treeTrunkG(self) -> np.ndarray:
+        """ Point collection for the tree trunk. """
+        return line3DArray(
             self.o + ivec3(-4, 0, self.sign * -5),
             self.o + ivec3(-4, 5, self.sign * -5)
         )
 
-    @property
-    def treeLeavesG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the tree leaves. """
-        yield from fittingCylinder(
-            self.o + ivec3(-1, 3, self.sign * -2),
-            self.o + ivec3(-7, 5, self.sign * -8)
-        )
-        yield from fittingCylinder(
-            self.o + ivec3(-2, 6, self.sign * -3),
-            self.o + ivec3(-6, 6, self.sign * -7)
-        )
-        yield from cuboid3D(
-            self.o + ivec3(-3, 7, self.sign * -4),
-            self.o + ivec3(-5, 7, self.sign * -6)
-        )
-        return
+    @cached_property
+    def treeLeavesG(self) -> np.ndarray:
+        """ Point collection for the tree leaves. """
+        return _translate(_TREE_LEAVES, self.o, self.sign)
 
-    @property
-    def floorGapG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the floor gap. """
-        return cuboid3D(
+    @cached_property
+    def floorGapG(self) -> np.ndarray:
+        """ Point collection for the floor gap. """
+        return cuboid3DArray(
             self.o + ivec3(-3, 0, self.sign * -4),
             self.o + ivec3(-5, 0, self.sign * -6)
         )
     
-    @property
-    def canalG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the canal. """
-        pc = []
-        pc.extend(line3D(
+    @cached_property
+    def canalG(self) -> np.ndarray:
+        """ Point collection for the canal (with a gap in front of the house door). """
+        pc = unique(np.concatenate([cuboid3DArray(
             self.o + ivec3(-4, 0, self.sign * 2),
             self.o + ivec3(-4, 0, self.sign * 8)
-        ))
-        pc.extend(line3D(
+        ), cuboid3DArray(
             self.o + ivec3(4, 0, self.sign * 2),
             self.o + ivec3(4, 0, self.sign * 8)
-        ))
-        pc.extend(line3D(
+        ), cuboid3DArray(
             self.o + ivec3(-4, 0, self.sign * 2),
             self.o + ivec3(4, 0, self.sign * 2)
-        ))
-        pc.remove(self.o + ivec3(-2, 0, self.sign * 2))
-        yield from pc
-
-    @property
-    def grassBlocksG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the grass blocks. """
-        yield from triangle(self.o + ivec3(4, 0, self.sign * 4), 5, self.direction + 'e')
-        yield from triangle(self.o + ivec3(-4, 0, self.sign * 4), 5, self.direction + 'w')
-        yield from triangle(self.o + ivec3(4, 0, self.sign * 3), 5, self.opp(self.direction) + 'e')
-        yield from triangle(self.o + ivec3(-4, 0, self.sign * 3), 5, self.opp(self.direction) + 'w')
-        yield from cuboid3D(
-            self.o + ivec3(-3, 0, self.sign * 4),
-            self.o + ivec3(3, 0, self.sign * 9)
-        )
-        yield from cuboid3D(
-            self.o + ivec3(-3, 0, self.sign * 3),
-            self.o + ivec3(3, 0, self.sign * -1)
-        )
-        yield from cuboid3D(
-            self.o + ivec3(-3, -1, self.sign * -4),
-            self.o + ivec3(-5, -1, self.sign * -6)
-        )
-        yield from cuboid3D(
-            self.o + ivec3(-4, -1, self.sign * 2),
-            self.o + ivec3(4, -1, self.sign * 8)
-        )
-        return
+        )]))
+        return pc[np.any(pc != self.o + ivec3(-2, 0, self.sign * 2), axis=1)]
+
+    @cached_property
+    def grassBlocksG(self) -> np.ndarray:
+        """ Point collection for the grass blocks (the triangles and cuboids overlap). """
+        return unique(np.concatenate([
+            triangleArray(self.o + ivec3(4, 0, self.sign * 4), 5, self.direction + 'e'),
+            triangleArray(self.o + ivec3(-4, 0, self.sign * 4), 5, self.direction + 'w'),
+            triangleArray(self.o + ivec3(4, 0, self.sign * 3), 5, self.opp(self.direction) + 'e'),
+            triangleArray(self.o + ivec3(-4, 0, self.sign * 3), 5, self.opp(self.direction) + 'w'),
+            cuboid3DArray(
+                self.o + ivec3(-3, 0, self.sign * 4),
+                self.o + ivec3(3, 0, self.sign * 9)
+            ),
+            cuboid3DArray(
+                self.o + ivec3(-3, 0, self.sign * 3),
+                self.o + ivec3(3, 0, self.sign * -1)
+            ),
+            cuboid3DArray(
+                self.o + ivec3(-3, -1, self.sign * -4),
+                self.o + ivec3(-5, -1, self.sign * -6)
+            ),
+            cuboid3DArray(
+                self.o + ivec3(-4, -1, self.sign * 2),
+                self.o + ivec3(4, -1, self.sign * 8)
+            )
+        ]))
 
-    @property
-    def boundsG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the bounds of the garden. """
-        yield from line3D(
+    @cached_property
+    def boundsG(self) -> np.ndarray:
+        """ Point collection for the bounds of the garden. """
+        return unique(np.concatenate([line3DArray(
             self.o + ivec3(-4, 0, self.sign * -2),
             self.o + ivec3(4, 0, self.sign * -2)
-        )
-        yield from line3D(
+        ), line3DArray(
             self.o + ivec3(-4, 0, self.sign * -2),
             self.o + ivec3(-9, 0, self.sign * +3)
-        )
-        yield from line3D(
+        ), line3DArray(
             self.o + ivec3(4, 0, self.sign * -2),
             self.o + ivec3(9, 0, self.sign * +3)
-        )
-        return
+        )]))
 
     def opp(self, direction: str) -> str:
         """ Opposite direction. """
-        return {'n': 's', 's': 'n'}[direction]
+        return _OPPOSITE[direction]
 
 
 class ExoticGarden:
@@ -466,87 +478,88 @@ class ExoticGarden:
         self.vinesName = 'weeping' if kind == 'crimson' else 'twisting'
         return
 
+    @buffered
     def place(self, editor: Editor):
         """ Place the structure. """
-        editor.placeBlock(self.nyliumG, Block(f'{self.kind}_nylium'))
-        editor.placeBlock(self.hyphaeG, Block(f'{self.kind}_hyphae'))
-        editor.placeBlock(self.boundsG, Block(f'{self.kind}_planks'))
-        editor.placeBlock(self.fencesG, Block(f'{self.kind}_fence'))
-        editor.placeBlock(self.rootsG, Block(f'{self.kind}_roots'))
-        editor.placeBlock(self.vinesG, Block(f'{self.vinesName}_vines'))
+        editor.placeBlock(self.nyliumG, stateBlock(f'{self.kind}_nylium'))
+        editor.placeBlock(self.hyphaeG, stateBlock(f'{self.kind}_hyphae'))
+        editor.placeBlock(self.boundsG, stateBlock(f'{self.kind}_planks'))
+        editor.placeBlock(self.fencesG, stateBlock(f'{self.kind}_fence'))
+        editor.placeBlock(self.rootsG, stateBlock(f'{self.kind}_roots'))
+        editor.placeBlock(self.vinesG, stateBlock(f'{self.vinesName}_vines'))
         return
 
-    @property
-    def nyliumG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the nylium blocks. """
-        return triangle(self.o + ivec3(self.xSign, 0, self.zSign), 6, self.district)
+    @cached_property
+    def nyliumG(self) -> np.ndarray:
+        """ Point collection for the nylium blocks. """
+        return triangleArray(self.o + ivec3(self.xSign, 0, self.zSign), 6, self.district)
     
-    @property
-    def hyphaeG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the hyphae blocks. """
-        yield from [p + Y * self.height for p in self.nyliumG]
+    @cached_property
+    def hyphaeG(self) -> np.ndarray:
+        """ Point collection for the hyphae blocks. """
+        return self.nyliumG + np.array([0, self.height, 0], dtype=np.int32)
     
-    @property
-    def boundsG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the garden bounds. """
+    @cached_property
+    def boundsG(self) -> np.ndarray:
+        """ Point collection for the garden bounds. """
         o, h = self.o, self.height
         xs, zs = self.xSign, self.zSign
+        pc = []
         for y in [0, self.height]:
-            yield from line3D(o + ivec3(0, y, 0), o + ivec3(xs * 6, y, 0))
-            yield from line3D(o + ivec3(0, y, 0), o + ivec3(0, y, zs * 6))
+            pc.append(line3DArray(o + ivec3(0, y, 0), o + ivec3(xs * 6, y, 0)))
+            pc.append(line3DArray(o + ivec3(0, y, 0), o + ivec3(0, y, zs * 6)))
         for x, z in [(0, 6), (6, 0)]:
-            yield from line3D(o + ivec3(xs * x, 1, zs * z), o + ivec3(xs * x, h-1, zs * z))
+            pc.append(line3DArray(o + ivec3(xs * x, 1, zs * z), o + ivec3(xs * x, h-1, zs * z)))
+        # the two lines on each level meet at the corner
+        return unique(np.concatenate(pc))
     
-    @property
-    def fencesG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the garden fences. """
+    @cached_property
+    def fencesG(self) -> np.ndarray:
+        """ Point collection for the garden fences. """
         o, h = self.o, self.height
         xs, zs = self.xSign, self.zSign
+        pc = []
         for x in range(0, 5, 2):
-            yield from line3D(o + ivec3(xs * x, 1, 0), o + ivec3(xs * x, h-1, 0))
+            pc.append(line3DArray(o + ivec3(xs * x, 1, 0), o + ivec3(xs * x, h-1, 0)))
         for z in range(0, 5, 2):
-            yield from line3D(o + ivec3(0, 1, zs * z), o + ivec3(0, h-1, zs * z))
+            pc.append(line3DArray(o + ivec3(0, 1, zs * z), o + ivec3(0, h-1, zs * z)))
+        return np.concatenate(pc)
 
     @property
-    def vinesG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the vines. """
+    def vinesG(self) -> np.ndarray:
+        """ Point collection for the vines. """
         return self.weepingVinesG if self.kind == 'crimson' else self.twistingVinesG
 
     @property
-    def weepingVinesG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the weeping vines. """
-        candidates = list(self.hyphaeG)
-        origins = [candidates[i] for i in np.random.choice(len(candidates), 5, replace=False)]
-        for o in origins:
-            yield from [o - Y * i for i in range(0, np.random.randint(3, 7))]
-        return
+    def weepingVinesG(self) -> np.ndarray:
+        """ Point collection for the weeping vines. """
+        candidates = self.hyphaeG
+        origins = candidates[rng.choice(len(candidates), 5, replace=False, shuffle=False)]
+        return columns(origins, rng.integers(3, 7, size=5), step=-1)
 
     @property
-    def twistingVinesG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the twisting vines. """
-        candidates = list(self.nyliumG)
-        candidates = list(filter(lambda p: p not in self.rootsG, candidates))
-        origins = [candidates[i] for i in np.random.choice(len(candidates), 5, replace=False)]
-        for o in origins:
-            yield from [o + Y * i for i in range(1, np.random.randint(4, 8))]
-        return
+    def twistingVinesG(self) -> np.ndarray:
+        """ Point collection for the twisting vines. """
+        # the roots stand one block above their nylium, so compare them on the nylium level
+        candidates = difference(self.nyliumG, self.rootsG - np.array([0, 1, 0], dtype=np.int32))
+        origins = candidates[rng.choice(len(candidates), 5, replace=False, shuffle=False)]
+        return columns(origins, rng.integers(4, 8, size=5), start=1)
 
-    @property
-    def rootsG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the roots. """
-        candidates = list(self.nyliumG)
-        yield from [candidates[i] + Y for i in np.random.choice(len(candidates), 5, replace=False)]
-        return
+    @cached_property
+    def rootsG(self) -> np.ndarray:
+        """ Point collection for the roots (sampled once, so vines can avoid them). """
+        candidates = self.nyliumG
+        return candidates[rng.choice(len(candidates), 5, replace=False, shuffle=False)] + (0, 1, 0)
     
-    @property
+    @cached_property
     def xSign(self) -> int:
         """ Sign of the x coordinate. """
-        return {'w': -1, 'e': 1}[self.district[1]]
+        return _X_SIGN[self.district[1]]
     
-    @property
+    @cached_property
     def zSign(self) -> int:
         """ Sign of the z coordinate. """
-        return {'n': -1, 's': 1}[self.district[0]]
+        return _Z_SIGN[self.district[0]]
 
 
 class Table:
@@ -561,6 +574,7 @@ class Table:
         self.plant = plant
         return
 
+    @buffered
     def place(self, editor: Editor) -> None:
         """ Place the table in Minecraft. """
         editor.placeBlock(self.baseG, self.baseM)
@@ -570,35 +584,25 @@ class Table:
         editor.placeBlock(self.o + Y*2, pot(self.plant))
         return
 
-    @property
-    def baseG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the table base. """
-        return cuboid3D(
-            self.o + ivec3(-1, -1, -1),
-            self.o + ivec3(+1, -1, +1)
-        )
+    @cached_property
+    def baseG(self) -> np.ndarray:
+        """ Point collection for the table base. """
+        return _translate(_SLAB_3X3, self.o - Y)
 
     @property
-    def cutoutG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the table cutout. """
-        return cuboid3D(
-            self.o + ivec3(-1, 0, -1),
-            self.o + ivec3(+1, 0, +1)
-        )
+    def cutoutG(self) -> np.ndarray:
+        """ Point collection for the table cutout. """
+        return _translate(_SLAB_3X3, self.o)
 
-    @property
-    def legsG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the table legs. """
-        for x, z in [(-1, -1), (-1, +1), (+1, -1), (+1, +1)]:
-            yield self.o + ivec3(x, 0, z)
+    @cached_property
+    def legsG(self) -> np.ndarray:
+        """ Point collection for the table legs. """
+        return _translate(_SLAB_3X3_CORNERS, self.o)
 
-    @property
-    def topG(self) -> Generator[ivec3, None, None]:
-        """ Generator for the tabletop. """
-        return cuboid3D(
-            self.o + ivec3(-1, 1, -1),
-            self.o + ivec3(+1, 1, +1)
-        )
+    @cached_property
+    def topG(self) -> np.ndarray:
+        """ Point collection for the tabletop. """
+        return _translate(_SLAB_3X3, self.o + Y)
 
 
 class EndPortal:
@@ -608,34 +612,14 @@ class EndPortal:
         self.o = origin
         return
     
+    @buffered
     def place(self, editor: Editor) -> None:
         """ Place the end portal in Minecraft. """
-        editor.placeBlock(
-            cuboid3D(self.o + ivec3(-1, -1, -1), self.o + ivec3(1, -1, 1)),
-            Block('deepslate_tiles')
-        )
-        editor.placeBlock(
-            cuboid3D(self.o + ivec3(-1, 0, -1), self.o + ivec3(1, 0, 1)),
-            Block('end_portal')
-        )
-        for x1, x2, z1, z2, facing in (
-            (-2, 2, -2, -2, 'south'),
-            (-2, 2, 2, 2, 'north'),
-            (-2, -2, -2, 2, 'east'),
-            (2, 2, -2, 2, 'west')
-        ):
-            editor.placeBlock(
-                line3D(self.o + ivec3(x1, 0, z1), self.o + ivec3(x2, 0, z2)),
-                Block('end_portal_frame', {'facing': facing, 'eye': 'true'})
-            )
-            editor.placeBlock(
-                line3D(self.o + ivec3(x1, 1, z1), self.o + ivec3(x2, 1, z2)),
-                Block('deepslate_tile_wall')
-            )
-        for x, z in ((-2, -2), (-2, 2), (2, -2), (2, 2)):
-            editor.placeBlock(self.o + ivec3(x, 0, z), Block('deepslate_tiles'))
-        editor.placeBlock(
-            cuboid3D(self.o + ivec3(-2, 2, -2), self.o + ivec3(2, 2, 2)),
-            Block('deepslate_tile_slab', {'type': 'bottom'})
-        )
+        editor.placeBlock(_translate(_SLAB_3X3, self.o - Y), DeepslateTiles)
+        editor.placeBlock(_translate(_SLAB_3X3, self.o), EndPortalBlock)
+        for facing, pc in _END_PORTAL_FRAME.items():
+            editor.placeBlock(_translate(pc, self.o), stateBlock('end_portal_frame', facing=facing, eye='true'))
+        editor.placeBlock(_translate(_RING_5X5_CORNERS, self.o), DeepslateTiles)
+        editor.placeBlock(_translate(_RING_5X5, self.o + Y), DeepslateTileWall)
+        editor.placeBlock(_translate(_SLAB_5X5, self.o + Y * 2), stateBlock('deepslate_tile_slab', type='bottom'))
         return
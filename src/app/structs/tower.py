@@ -4,7 +4,8 @@
 All tower-related classes are defined here.
 """
 
-from typing import Generator, Sequence
+from typing import Sequence
+from functools import cached_property
 
 import numpy as np
 
@@ -12,9 +13,41 @@ from gdpc import Block, Editor
 from gdpc.vector_tools import Y
 from glm import ivec3
 
-from generators import fittingCylinder, cuboid3D, line3D, pyramid, cone
-from materials import Air, Netherite, Beacon, GlowStone, IronBars
-
+from generators import pyramidArray, coneArray, columns
+from generators import cuboid3DArray, fittingCylinderArray, unique
+from materials import stateBlock, Air, Netherite, Beacon, GlowStone, IronBars
+from helper import buffered
+
+
+_FACING = {'n': 'north', 'e': 'east', 's': 'south', 'w': 'west'}
+_OPPOSITE_FACING = {'north': 'south', 'east': 'west', 'south': 'north', 'west': 'east'}
+_NEXT_FACING = {'north': 'east', 'east': 'south', 'south': 'west', 'west': 'north'}
+_X_SIGN = {'west': -1, 'east': +1}
+_Z_SIGN = {'north': -1, 'south': +1}
+_ROOF_ACCESS_X_SIGN = {'east': -1, 'west': +1}
+_STAIRWAY_SIGN = {'w': +1, 'e': -1}
+_STAIRWAY_FACING = {'w': 'north', 'e': 'south'}
+_STAIRWAY_CHEST_FACING = {'e': 'north', 'w': 'south'}
+_CHEST_ITEMS = {
+    'nostalgic': 'minecraft:apple',
+    'crimson': 'minecraft:ender_pearl',
+    'warped': 'minecraft:ender_pearl',
+    'endgame': 'minecraft:golden_apple'
+}
+_ENTRANCE_DIRECTIONS = {
+    'nw': ('south', 'east'),
+    'sw': ('north', 'east'),
+    'se': ('north', 'west'),
+    'ne': ('south', 'west')
+}
+
+# (x1, x2, z1, z2) of the n-th set of stairs, to be multiplied by the stairway's sign
+_STAIR_ORIENTATIONS = ((1, 0, 0, -1), (0, 1, 1, 0), (-1, 0, 0, 1), (0, -1, -1, 0))
+# relative positions of the steps of each set of stairs (i = 1..5 down, j = -1..1 across)
+_i, _j = (a.ravel() for a in np.meshgrid(np.arange(1, 6), np.arange(-1, 2), indexing='ij'))
+_STAIR_STEPS = tuple(np.stack([x, -_i, z], axis=1).astype(np.int32) for x, z in [
+    (_j, _i), (-_i, _j), (_j, -_i), (_i, _j)
+])
 
 class TowerBase:
     """
@@ -40,6 +73,7 @@ class TowerBase:
         self.radius = radius
         return
     
+    @buffered
     def place(self, editor: Editor) -> None:
         """ Place the tower base in Minecraft. """
         editor.placeBlock(self.wallsG, self.m)
@@ -51,22 +85,22 @@ class TowerBase:
         Returns the max height needed to extend the tower base.
         """
         heightMapOF, heightMapMBNL = heightMaps
-        wallsPC = list(self.wallsG)
-        wallsSilhouette = set([p for p in wallsPC if p.y == self.o.y])
-        maxHeight = 0
-        for p in wallsSilhouette:
-            x, z = p.x - center.x - 51, p.z - center.z - 51
-            groundHeight = min(heightMapOF[x, z], heightMapMBNL[x, z])
-            buildHeight = p.y - groundHeight
-            maxHeight = max(maxHeight, buildHeight)
-            editor.placeBlock(line3D(p, p - Y * buildHeight), self.m)
-        return maxHeight
+        wallsPC = self.wallsG
+        wallsSilhouette = np.unique(wallsPC[wallsPC[:, 1] == self.o.y], axis=0)
+        x, z = wallsSilhouette[:, 0] - center.x - 51, wallsSilhouette[:, 2] - center.z - 51
+        groundHeight = np.minimum(heightMapOF[x, z], heightMapMBNL[x, z])
+        buildHeight = wallsSilhouette[:, 1] - groundHeight
+        # every column runs from the silhouette down to the ground (or up, if the ground is higher);
+        # like line3D, a column of height 0 is left out entirely
+        lengths = np.where(buildHeight != 0, np.abs(buildHeight) + 1, 0)
+        editor.placeBlock(columns(wallsSilhouette, lengths, step=-np.sign(buildHeight)), self.m)
+        return int(buildHeight.max(initial=0))
     
-    @property
-    def wallsG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the walls. """
+    @cached_property
+    def wallsG(self) -> np.ndarray:
+        """ Point collection for positions of the walls. """
         r, h = self.radius, self.height
-        return fittingCylinder(
+        return fittingCylinderArray(
             self.o + ivec3(-r, 0, -r),
             self.o + ivec3(r, h, r),
             tube = True
@@ -95,16 +129,17 @@ class TowerRoom:
         self.radius = radius
         return
 
+    @buffered
     def place(self, editor: Editor) -> None:
         """ Place the tower room in Minecraft. """
         editor.placeBlock(self.wallsG, self.m)
         return
 
-    @property
-    def wallsG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the walls. """
+    @cached_property
+    def wallsG(self) -> np.ndarray:
+        """ Point collection for positions of the walls. """
         r, h = self.radius, self.height
-        return fittingCylinder(
+        return fittingCylinderArray(
             self.o + ivec3(-r, 0, -r),
             self.o + ivec3(r, h, r),
             hollow = True
@@ -143,49 +178,56 @@ class TowerRoof:
         self.radius = radius
         return
 
+    @buffered
     def place(self, editor: Editor) -> None:
         """ Place all blocks of the tower roof in Minecraft. """
-        editor.placeBlock(self.floorG, self.baseM)
-        editor.placeBlock(self.guardsG, self.baseM)
+        # the guards share their bottom ring with the floor
+        editor.placeBlock(unique(np.concatenate([self.floorG, self.guardsG])), self.baseM)
         editor.placeBlock(self.beaconPyramidG, Netherite)
         editor.placeBlock(self.o + Y * 4, Beacon)
-        editor.placeBlock(self.coneG, self.coneM)
-        editor.placeBlock(self.o + Y * self.height, Air)
-        stainedGlass = Block(f'{self.beaconColor}_stained_glass')
-        editor.placeBlock(self.o + Y * (self.height-1), stainedGlass)
+        # the apex of the cone is left open for the beacon beam
+        apex = self.o + Y * self.height
+        editor.placeBlock(self.coneG[np.any(self.coneG != apex, axis=1)], self.coneM)
+        editor.placeBlock(apex, Air)
+        editor.placeBlock(self.o + Y * (self.height-1), self.stainedGlass)
         return
 
     @property
-    def floorG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the floor. """
+    def stainedGlass(self) -> Block:
+        """ The stained glass that colors the beacon beam (shared by all roofs of the same color). """
+        return stateBlock(f'{self.beaconColor}_stained_glass')
+
+    @cached_property
+    def floorG(self) -> np.ndarray:
+        """ Point collection for positions of the floor. """
         r = self.radius
-        return fittingCylinder(
+        return fittingCylinderArray(
             self.o + ivec3(-r, 0, -r),
             self.o + ivec3(r, 0, r)
         )
     
-    @property
-    def guardsG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the guards. """
+    @cached_property
+    def guardsG(self) -> np.ndarray:
+        """ Point collection for positions of the guards. """
         r = self.radius
-        return fittingCylinder(
+        return fittingCylinderArray(
             self.o + ivec3(-r, -1, -r),
             self.o + ivec3(r, 1, r),
             tube = True
         )
     
-    @property
-    def beaconPyramidG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the beacon pyramid. """
-        return pyramid(
+    @cached_property
+    def beaconPyramidG(self) -> np.ndarray:
+        """ Point collection for positions of the beacon pyramid. """
+        return pyramidArray(
             origin = self.o + Y,
             height = 4
         )
     
-    @property
-    def coneG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the cone. """
-        return cone(
+    @cached_property
+    def coneG(self) -> np.ndarray:
+        """ Point collection for positions of the cone. """
+        return coneArray(
             origin = self.o + Y,
             height = self.height,
             hollow = True
@@ -225,81 +267,91 @@ class TowerRoofAccess:
         self.roomH = roomHeight
         return
 
+    @buffered
     def place(self, editor: Editor) -> None:
         """ Place all blocks of the tower roof access construction in Minecraft. """
         editor.placeBlock(self.platformG, self.baseM)
-        ladder = Block('ladder', {'facing': self.notFacing})
-        editor.placeBlock(self.ladderG, ladder)
-        self.stairM.setFacing(self.notFacing)
-        for stairG in self.stairsG[:2]:
-            editor.placeBlock(stairG, self.stairM)
-        self.stairM.setFacing(self.facing)
-        editor.placeBlock(self.stairsG[2], self.stairM)
+        editor.placeBlock(self.ladderG, self.ladder)
+        stairs, offsets = self.stairsG, self.stairsOffsets
+        editor.placeBlock(stairs[:offsets[2]], self.stairM.withStates(facing=self.notFacing))
+        editor.placeBlock(stairs[offsets[2]:offsets[3]], self.stairM.withStates(facing=self.facing))
         editor.placeBlock(self.gateG, self.gateM)
-        for gapG in self.gapsG:
-            editor.placeBlock(gapG, Air)
+        editor.placeBlock(self.gapsG, Air)
         return
 
-    @property
+    @cached_property
     def facing(self) -> str:
-        return {'w': 'west', 'e': 'east'}[self.district[1]]
+        return _FACING[self.district[1]]
 
     @property
+    def ladder(self) -> Block:
+        """ The ladder block, attached to the wall opposite of the exit. """
+        return stateBlock('ladder', facing=self.notFacing)
+
+    @cached_property
     def notFacing(self) -> str:
-        return {'west': 'east', 'east': 'west'}[self.facing]
+        return _OPPOSITE_FACING[self.facing]
 
-    @property
+    @cached_property
     def xSign(self) -> int:
-        return {'east': -1, 'west': +1}[self.facing]
+        return _ROOF_ACCESS_X_SIGN[self.facing]
 
-    @property
-    def platformG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the platform. """
-        return cuboid3D(
+    @cached_property
+    def platformG(self) -> np.ndarray:
+        """ Point collection for positions of the platform. """
+        return cuboid3DArray(
             self.o + ivec3(self.xSign * +0, -1, -4),
             self.o + ivec3(self.xSign * +1, -1, +4)
         )
     
-    @property
-    def ladderG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the ladder. """
-        return cuboid3D(
+    @cached_property
+    def ladderG(self) -> np.ndarray:
+        """ Point collection for positions of the ladder. """
+        return cuboid3DArray(
             self.o + ivec3(0, -self.roomH+1, -1),
             self.o + ivec3(0,            -1, +1)
         )
     
-    @property
-    def stairsG(self) -> Sequence[Generator[ivec3, None, None]]:
-        """ Generator for positions of the three sets of stairs. """
-        return [cuboid3D(
+    @cached_property
+    def stairsG(self) -> np.ndarray:
+        """
+        Point collection for positions of the three sets of stairs, back to back.
+        Set i is `stairsG[stairsOffsets[i]:stairsOffsets[i+1]]`.
+        """
+        return np.concatenate([cuboid3DArray(
             self.o + ivec3(self.xSign * +1, -1, -1),
             self.o + ivec3(self.xSign * +1, -1, +1)
-        ), cuboid3D(
+        ), cuboid3DArray(
             self.o + ivec3(self.xSign * +2, 0, -1),
             self.o + ivec3(self.xSign * +2, 0, +1)
-        ), cuboid3D(
+        ), cuboid3DArray(
             self.o + ivec3(self.xSign * -1, 0, -1),
             self.o + ivec3(self.xSign * -1, 0, +1)
-        )]
-    
+        )])
+
     @property
-    def gateG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the gate. """
-        return cuboid3D(
+    def stairsOffsets(self) -> np.ndarray:
+        """ Boundaries of the sets of stairs in `stairsG` (every set is a row of 3 stairs). """
+        return np.arange(4) * 3
+    
+    @cached_property
+    def gateG(self) -> np.ndarray:
+        """ Point collection for positions of the gate. """
+        return cuboid3DArray(
             self.o + ivec3(self.xSign * 0, +1, -2),
             self.o + ivec3(self.xSign * 2, +3, +2)
         )
     
-    @property
-    def gapsG(self) -> Sequence[Generator[ivec3, None, None]]:
-        """ Generator for positions of the two gaps of air. """
-        return [cuboid3D(
+    @cached_property
+    def gapsG(self) -> np.ndarray:
+        """ Point collection for positions of the two gaps of air. """
+        return np.concatenate([cuboid3DArray(
             self.o + ivec3(self.xSign * +0, +1, -1),
             self.o + ivec3(self.xSign * +2, +2, +1)
-        ), cuboid3D(
+        ), cuboid3DArray(
             self.o + ivec3(self.xSign * +0, 0, -1),
             self.o + ivec3(self.xSign * +1, 0, +1)
-        )]
+        )])
 
 
 class TowerStairway:
@@ -322,122 +374,107 @@ class TowerStairway:
         self.levels = levels
         return
 
+    @buffered
     def place(self, editor: Editor) -> None:
         """ Place all blocks of the tower spiral stair"""
         editor.placeBlock(self.baselineG, self.baseM)
         editor.placeBlock(self.cutoutG, Air)
-        facing = {'w': 'north', 'e': 'south'}[self.district[1]]
-        self.stairM.setFacing(facing)
-        editor.placeBlock(self.initialStairsG, self.stairM)
+        stairs = {facing: self.stairM.withStates(facing=facing) for facing in _NEXT_FACING}
+        facing = _STAIRWAY_FACING[self.district[1]]
+        editor.placeBlock(self.initialStairsG, stairs[facing])
         editor.placeBlock(self.firstPlateauG, self.baseM)
         chestPos = self.o + ivec3(self.sign * -2, -2, self.sign * +2)
         editor.placeBlock(chestPos, self.startChest)
         for n in range(1, self.levels+1):
             facing = self._next(facing)
-            self.stairM.setFacing(facing)
-            editor.placeBlock(self.setOfStairsG(n), self.stairM)
+            stairsPC = self.setOfStairsG(n)
+            editor.placeBlock(stairsPC, stairs[facing])
             if n > 1:
-                editor.placeBlock(self.setOfStairsAirG(n), Air)
-            editor.placeBlock(self.setOfStairsSupportG(n), self.baseM)
+                editor.placeBlock(self.setOfStairsAirG(stairsPC), Air)
+            editor.placeBlock(stairsPC - (0, 1, 0), self.baseM)
             if n < self.levels:
                 editor.placeBlock(self.plateauG(n), self.baseM)
                 editor.placeBlock(self.plateauAirG(n), Air)
         return
 
     @property
-    def baselineG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the baseline. """
-        for i in [0, 1, 2]:
-            yield from cuboid3D(
-                self.o + ivec3(self.sign * +2, -(i+1), self.sign * +i),
-                self.o + ivec3(self.sign * -2, -(i+1), self.sign * +(i+1))
-            )
+    def baselineG(self) -> np.ndarray:
+        """ Point collection for positions of the baseline. """
+        return np.concatenate([cuboid3DArray(
+            self.o + ivec3(self.sign * +2, -(i+1), self.sign * +i),
+            self.o + ivec3(self.sign * -2, -(i+1), self.sign * +(i+1))
+        ) for i in [0, 1, 2]])
 
     @property
-    def cutoutG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the cutout. """
-        return cuboid3D(
+    def cutoutG(self) -> np.ndarray:
+        """ Point collection for positions of the cutout. """
+        return cuboid3DArray(
             self.o + ivec3(self.sign * -1, -1, self.sign * +1),
             self.o + ivec3(self.sign * +1, +3, self.sign * +2)
         )
     
     @property
-    def initialStairsG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the initial stair. """
-        for i in [0, 1, 2]:
-            yield from line3D(
-                self.o + ivec3(self.sign * -1, -i, self.sign * +i),
-                self.o + ivec3(self.sign * +1, -i, self.sign * +i)
-            )
+    def initialStairsG(self) -> np.ndarray:
+        """ Point collection for positions of the initial stair. """
+        return np.concatenate([cuboid3DArray(
+            self.o + ivec3(self.sign * -1, -i, self.sign * +i),
+            self.o + ivec3(self.sign * +1, -i, self.sign * +i)
+        ) for i in [0, 1, 2]])
     
     @property
-    def firstPlateauG(self) -> Generator[ivec3, None, None]:
-        """ Generator for positions of the first plateau. """
-        for i in range(6):
-            yield from line3D(
-                self.o + ivec3(self.sign * (-2-i), -3, self.sign * (3+i)),
-                self.o + ivec3(self.sign * (+2-i), -3, self.sign * (3+i))
-            )
-        for i in range(4):
-            yield from line3D(
-                self.o + ivec3(self.sign * -9,     -3, self.sign * (9+i)),
-                self.o + ivec3(self.sign * (-4-i), -3, self.sign * (9+i))
-            )
-
-    def setOfStairsG(self, n: int) -> Generator[ivec3, None, None]:
-        """ Generator for the n-th set of stairs. """
+    def firstPlateauG(self) -> np.ndarray:
+        """ Point collection for positions of the first plateau. """
+        return np.concatenate([cuboid3DArray(
+            self.o + ivec3(self.sign * (-2-i), -3, self.sign * (3+i)),
+            self.o + ivec3(self.sign * (+2-i), -3, self.sign * (3+i))
+        ) for i in range(6)] + [cuboid3DArray(
+            self.o + ivec3(self.sign * -9,     -3, self.sign * (9+i)),
+            self.o + ivec3(self.sign * (-4-i), -3, self.sign * (9+i))
+        ) for i in range(4)])
+
+    def setOfStairsG(self, n: int) -> np.ndarray:
+        """ Point collection for the n-th set of stairs. """
         
         s = self.sign
-        x1, x2, z1, z2 = [(s, 0, 0, -s), (0, s, s, 0), (-s, 0, 0, s), (0, -s, -s, 0)][n % 4]
-        o = ivec3(
-            self.towerO.x + x1 * (self.baseR + 2) + x2 * 3,
+        tx, tz = self.towerO.x, self.towerO.z
+        r = self.baseR
+        x1, x2, z1, z2 = _STAIR_ORIENTATIONS[n % 4]
+        o = np.array([
+            tx + s * (x1 * (r+2) + x2 * 3),
             self.o.y + 2-(5*n)+1,
-            self.towerO.z + z1 * (self.baseR + 2) + z2 * 3
-        )
-
-        for i in range(1, 6):
-            yield from [
-                line3D(o + ivec3(s *-1, -i, s*+i), o + ivec3(s *+1, -i, s*+i)),
-                line3D(o + ivec3(s *-i, -i, s*+1), o + ivec3(s *-i, -i, s*-1)),
-                line3D(o + ivec3(s *-1, -i, s*-i), o + ivec3(s *+1, -i, s*-i)),
-                line3D(o + ivec3(s *+i, -i, s*+1), o + ivec3(s *+i, -i, s*-1))
-            ][n % 4]
+            tz + s * (z1 * (r+2) + z2 * 3)
+        ], dtype=np.int32)
+        return _STAIR_STEPS[n % 4] * np.array([s, 1, s], dtype=np.int32) + o
     
-    def setOfStairsAirG(self, n: int) -> Generator[ivec3, None, None]:
-        """ Generator for the air blocks above the n-th set of stairs. """
-        for p in self.setOfStairsG(n):
-            yield from line3D(p + Y, p + Y * 5)
-    
-    def setOfStairsSupportG(self, n: int) -> Generator[ivec3, None, None]:
-        """ Generator for the support blocks under the n-th set of stairs. """
-        yield from [p - Y for p in self.setOfStairsG(n)]
+    def setOfStairsAirG(self, stairsPC: np.ndarray) -> np.ndarray:
+        """ Point collection for the air blocks above a set of stairs (as returned by `setOfStairsG`). """
+        return columns(stairsPC, np.full(len(stairsPC), 6), start=1)
 
-    def plateauG(self, n: int) -> Generator[ivec3, None, None]:
-        """ Generator for the plateau connecting the n-th and the (n+1)-th set of stairs. """
+    def plateauG(self, n: int) -> np.ndarray:
+        """ Point collection for the plateau connecting the n-th and the (n+1)-th set of stairs. """
         s = self.sign
         xs, zs = [(s, s), (-s, s), (-s, -s), (s, -s)][n % 4]
         y = self.o.y + -3-(5*n)
         tx, tz = self.towerO.x, self.towerO.z
         r = self.baseR
-        return filter(lambda p:
-            np.linalg.norm(p - ivec3(tx, y, tz)) > r-1 and
-            np.linalg.norm(p - ivec3(tx, y, tz)) < r+4, cuboid3D(
-                ivec3(tx + xs * 3, y, tz + zs * 3),
-                ivec3(tx + xs * (r+3), y, tz + zs * (r+3))
-            )
+        pc = cuboid3DArray(
+            ivec3(tx + xs * 3, y, tz + zs * 3),
+            ivec3(tx + xs * (r+3), y, tz + zs * (r+3))
         )
+        d2 = (pc[:, 0] - tx)**2 + (pc[:, 2] - tz)**2
+        return pc[(d2 > (r-1)**2) & (d2 < (r+4)**2)]
     
-    def plateauAirG(self, n: int) -> Generator[ivec3, None, None]:
-        """ Generator for the air blocks above the plateau connecting the n-th and the (n+1)-th set of stairs. """
+    def plateauAirG(self, n: int) -> np.ndarray:
+        """ Point collection for the air blocks above the plateau connecting the n-th and the (n+1)-th set of stairs. """
         tx, tz = self.towerO.x, self.towerO.z
-        for p in self.plateauG(n):
-            if np.linalg.norm(p - ivec3(tx, p.y, tz)) > self.baseR + 1:
-                yield from line3D(p + Y, p + Y * 5)
+        pc = self.plateauG(n)
+        pc = pc[(pc[:, 0] - tx)**2 + (pc[:, 2] - tz)**2 > (self.baseR + 1)**2]
+        return columns(pc, np.full(len(pc), 6), start=1)
 
-    @property
+    @cached_property
     def startChest(self) -> Block:
         """ The chest block that is placed at the top of the stairway. """
-        facing = {'e': 'north', 'w': 'south'}[self.district[1]]
+        facing = self.startChestFacing
         items = [
             ('minecraft:stone_sword', 1),
             ('minecraft:bow', 1),
@@ -451,19 +488,24 @@ class TowerStairway:
         data = data[:-1] + ']}'
         return Block('chest', {'facing': facing}, data = data)
 
-    @property
+    @cached_property
+    def startChestFacing(self) -> str:
+        """ The facing of the chest at the top of the stairway. """
+        return _STAIRWAY_CHEST_FACING[self.district[1]]
+
+    @cached_property
     def sign(self) -> int:
         """ The sign of the stairway. """
-        return {'w': +1, 'e': -1}[self.district[1]]
+        return _STAIRWAY_SIGN[self.district[1]]
 
-    @property
+    @cached_property
     def o(self) -> ivec3:
         """ The reference point of the stairway. """
         return self.towerO + ivec3(self.sign * (self.baseR + 2), self.baseH, self.sign * 1)
 
     def _next(self, facing: str) -> str:
         """ The next facing. """
-        return {'north': 'east', 'east': 'south', 'south': 'west', 'west': 'north'}[facing]
+        return _NEXT_FACING[facing]
 
 
 class Tower:
@@ -486,8 +528,8 @@ class Tower:
 
         ! Note: tower.o(rigin) is set to room.o(rigin) !
         """
-        assert district in ['nw', 'sw', 'se', 'ne'], f'Invalid district: {district}'
-        assert interiorType in ['nostalgic', 'endgame', 'crimson', 'warped'], f'Invalid interior type: {interiorType}'
+        assert district in _ENTRANCE_DIRECTIONS, f'Invalid district: {district}'
+        assert interiorType in _CHEST_ITEMS, f'Invalid interior type: {interiorType}'
         self.district = district
         self.interiorType = interiorType
 
@@ -499,6 +541,7 @@ class Tower:
         self.extensionHeight = 0  # will be set by the builder afterwards
         return
 
+    @buffered
     def place(self, editor: Editor) -> None:
         """ Place the tower in Minecraft. """
         self.base.place(editor)
@@ -510,7 +553,7 @@ class Tower:
         editor.placeBlock(self.chestPos, self.chestBlock)
         return
 
-    @property
+    @cached_property
     def entranceOrigins(self) -> dict[str, ivec3]:
         """ Each tower has a unique set of 2 entrances, depending on its district. """
         return {
@@ -518,63 +561,51 @@ class Tower:
             'z':  self.o + ivec3(0, 0, self.zSign * self.room.radius)
         }
 
-    @property
-    def entranceDirections(self) -> list[str]:
+    @cached_property
+    def entranceDirections(self) -> tuple[str, str]:
         """ Each tower has a unique set of 2 entrance directions, depending on its district. """
-        return {
-            'nw': ['south', 'east'],
-            'sw': ['north', 'east'],
-            'se': ['north', 'west'],
-            'ne': ['south', 'west']
-        }[self.district]
+        return _ENTRANCE_DIRECTIONS[self.district]
     
-    @property
+    @cached_property
     def zSign(self) -> int:
-        return {'north': -1, 'south': +1}[self.entranceDirections[0]]
+        return _Z_SIGN[self.entranceDirections[0]]
 
-    @property
+    @cached_property
     def xSign(self) -> int:
-        return {'west': -1, 'east': +1}[self.entranceDirections[1]]
+        return _X_SIGN[self.entranceDirections[1]]
 
-    @property
-    def entrancesG(self) -> Sequence[Generator[ivec3, None, None]]:
-        """ Generator for positions of the two entrances. """
+    @cached_property
+    def entrancesG(self) -> np.ndarray:
+        """ Point collection for positions of the two entrances. """
         x, z = self.xSign, self.zSign
         r = self.room.radius
-        yield from cuboid3D(
+        return np.concatenate([cuboid3DArray(
             self.o + ivec3(x*r, 1, -1),
             self.o + ivec3(x*r, 3, +1)
-        )
-        yield from cuboid3D(
+        ), cuboid3DArray(
             self.o + ivec3(-1, 1, z*r),
             self.o + ivec3(+1, 3, z*r)
-        )
+        )])
     
-    @property
-    def windowsG(self) -> Sequence[Generator[ivec3, None, None]]:
-        """ Generator for positions of the windows. """
-        yield from line3D(
+    @cached_property
+    def windowsG(self) -> np.ndarray:
+        """ Point collection for positions of the windows. """
+        return np.concatenate([cuboid3DArray(
             self.o + ivec3(0, 2, self.zSign * -self.room.radius),
             self.o + ivec3(0, 6, self.zSign * -self.room.radius)
-        )
-        yield from line3D(
+        ), cuboid3DArray(
             self.o + ivec3(-1, 4, self.zSign * -self.room.radius),
             self.o + ivec3(+1, 4, self.zSign * -self.room.radius)
-        )
+        )])
 
     @property
     def chestPos(self) -> ivec3:
         """ The position of the chest in the tower. """
         return self.roof.o + ivec3(self.xSign * 5, 1, 0)
     
-    @property
+    @cached_property
     def chestBlock(self) -> Block:
         """ The block object of the tower's chest. """
-        item = {
-            'nostalgic': 'minecraft:apple',
-            'crimson': 'minecraft:ender_pearl',
-            'warped': 'minecraft:ender_pearl',
-            'endgame': 'minecraft:golden_apple'
-        }[self.interiorType]
-        facing = {'e': 'east', 'w': 'west'}[self.district[1]]
+        item = _CHEST_ITEMS[self.interiorType]
+        facing = _FACING[self.district[1]]
         return Block('chest', {'facing': facing}, data = f'{{Items:[{{Slot:13b,id:"{item}",Count:3b}}]}}')